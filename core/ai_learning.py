@@ -4,6 +4,7 @@ Intelligent system that improves over time based on usage patterns
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Dict, List, Any
 from datetime import datetime
@@ -58,8 +59,11 @@ class AILearningSystem:
     def _save_learning_data(self):
         """Save learning data to disk"""
         try:
-            with open(self.learning_file, 'w') as f:
+            # Write then rename, so a crash mid-write never leaves truncated JSON
+            temp_file = self.learning_file.with_name(f"{self.learning_file.name}.{os.getpid()}.tmp")
+            with open(temp_file, 'w') as f:
                 json.dump(self.learning_data, f, indent=2)
+            os.replace(temp_file, self.learning_file)
         except Exception as e:
             if self.logger:
                 self.logger.warning(f"Failed to save learning data: {e}")
@@ -207,9 +211,10 @@ class AILearningSystem:
             recommendations['reasoning'].append("Large document, enabling fast mode")
         
         if self.logger:
-            self.logger.info(f"🤖 AI Recommendations for {page_count} pages:")
-            for reason in recommendations['reasoning']:
-                self.logger.info(f"   • {reason}")
+            self.logger.info("\n".join(
+                [f"🤖 AI Recommendations for {page_count} pages:"] +
+                [f"   • {reason}" for reason in recommendations['reasoning']]
+            ))
         
         return recommendations
     
@@ -3,12 +3,43 @@ Blank Page Detection System
 Detects and removes blank pages from scanned documents
 """
 
+import sys
 import cv2
 import numpy as np
 from PIL import Image
 from typing import List, Tuple
 from dataclasses import dataclass
 
+# Numba is optional - it fuses the white/dark pixel counts into one pass
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _count_white_dark_numpy(gray: np.ndarray, white_level: int, dark_level: int) -> Tuple[int, int]:
+    """Count pixels brighter than white_level and darker than dark_level"""
+    return int(np.count_nonzero(gray > white_level)), int(np.count_nonzero(gray < dark_level))
+
+if NUMBA_AVAILABLE:
+    # No on-disk JIT cache in the frozen EXE (there is no source file to key it on)
+    @njit(cache=not getattr(sys, 'frozen', False), nogil=True)
+    def _count_white_dark(gray, white_level, dark_level):
+        """Single-pass white/dark pixel count (JIT-compiled, releases the GIL)"""
+        white = 0
+        dark = 0
+        height, width = gray.shape
+        for y in range(height):
+            for x in range(width):
+                value = gray[y, x]
+                if value > white_level:
+                    white += 1
+                elif value < dark_level:
+                    dark += 1
+        return white, dark
+else:
+    _count_white_dark = _count_white_dark_numpy
+
 @dataclass
 class BlankPageAnalysis:
     """Analysis result for a page"""
@@ -28,6 +59,13 @@ class BlankPageDetector:
         self.logger = logger
         self.blank_threshold = 0.95  # 95% white = blank
         self.edge_threshold = 0.01   # Very few edges = blank
+        self._warmup()
+    
+    @staticmethod
+    def _warmup():
+        """Compile (or load the cached) JIT kernel now, not on the first page"""
+        if NUMBA_AVAILABLE:
+            _count_white_dark(np.zeros((1, 1), dtype=np.uint8), 240, 100)
     
     def analyze_page(self, image: Image.Image) -> BlankPageAnalysis:
         """Analyze if a page is blank"""
@@ -35,17 +73,16 @@ class BlankPageDetector:
             # Convert to grayscale
             gray = np.array(image.convert('L'))
             
-            # Calculate white percentage
-            white_pixels = np.sum(gray > 240)
+            # Count white and dark pixels in one pass
+            white_pixels, dark_pixels = _count_white_dark(gray, 240, 100)
             total_pixels = gray.size
             white_percentage = white_pixels / total_pixels
             
             # Detect edges
             edges = cv2.Canny(gray, 50, 150)
-            edge_density = np.sum(edges > 0) / total_pixels
+            edge_density = np.count_nonzero(edges) / total_pixels
             
             # Check for text (any significant dark regions)
-            dark_pixels = np.sum(gray < 100)
             text_detected = (dark_pixels / total_pixels) > 0.01
             
             # Determine if blank
@@ -90,30 +127,61 @@ class BlankPageDetector:
                 text_detected=True
             )
     
-    def find_blank_pages(self, pages: List, mode: str = "all") -> List[int]:
+    def analyze_pages(self, pages: List, executor=None) -> List[BlankPageAnalysis]:
         """
-        Find blank pages based on mode
+        Analyze every page once and keep the result on the page
+        
+        The analysis is stored in page.metadata['blank_analysis'], so blank
+        removal and orientation fixing share it instead of each re-analyzing
+        the page. Pages are independent, so with an executor they are
+        analyzed in parallel (Canny and the JIT pixel count release the GIL).
         
         Args:
             pages: List of PageInfo objects
-            mode: "start", "end", "middle", "all", "none"
+            executor: Shared ThreadPoolExecutor (sequential if None)
         
         Returns:
-            List of indices of blank pages to remove
+            Analyses of the pages that have an image, with page_index set
         """
-        if mode == "none":
-            return []
+        pending = [page for page in pages
+                   if page.image and 'blank_analysis' not in page.metadata]
+        if pending:
+            images = [page.image for page in pending]
+            if executor is not None and len(pending) > 1:
+                results = executor.map(self.analyze_page, images)
+            else:
+                results = map(self.analyze_page, images)
+            for page, analysis in zip(pending, results):
+                page.metadata['blank_analysis'] = analysis
         
-        # Analyze all pages
         analyses = []
         for i, page in enumerate(pages):
             if not page.image:
                 continue
-            
-            analysis = self.analyze_page(page.image)
+            analysis = page.metadata['blank_analysis']
             analysis.page_index = i
             analyses.append(analysis)
-            
+        return analyses
+    
+    def find_blank_pages(self, pages: List, mode: str = "all", executor=None) -> List[int]:
+        """
+        Find blank pages based on mode
+        
+        Args:
+            pages: List of PageInfo objects
+            mode: "start", "end", "middle", "all", "none"
+            executor: Shared ThreadPoolExecutor for the page analysis
+        
+        Returns:
+            List of indices of blank pages to remove
+        """
+        if mode == "none":
+            return []
+        
+        # Analyze all pages
+        analyses = self.analyze_pages(pages, executor)
+        for analysis in analyses:
+            i = analysis.page_index
             if self.logger and analysis.is_blank:
                 self.logger.debug(
                     f"Page {i+1}: Blank detected "
@@ -187,49 +255,51 @@ class BlankPageDetector:
         
         return blank_indices
     
-    def remove_blank_pages(self, pages: List, mode: str = "start_end") -> Tuple[List, int]:
+    def remove_blank_pages(self, pages: List, mode: str = "start_end",
+                           executor=None) -> Tuple[List, int]:
         """
         Remove blank pages from list
         
         Returns:
             (filtered_pages, num_removed)
         """
-        blank_indices = self.find_blank_pages(pages, mode)
+        blank_indices = self.find_blank_pages(pages, mode, executor)
         
         if not blank_indices:
             return pages, 0
         
         # Filter out blank pages
+        blank_set = set(blank_indices)
         filtered_pages = [
             page for i, page in enumerate(pages)
-            if i not in blank_indices
+            if i not in blank_set
         ]
         
         return filtered_pages, len(blank_indices)
     
-    def rotate_blank_landscape_to_portrait(self, pages: List) -> Tuple[List, int]:
+    def rotate_blank_landscape_to_portrait(self, pages: List, executor=None) -> Tuple[List, int]:
         """
         Rotate blank landscape pages to portrait orientation
         
         Args:
             pages: List of PageInfo objects
+            executor: Shared ThreadPoolExecutor for the page analysis
         
         Returns:
             (updated_pages, num_rotated)
         """
         num_rotated = 0
         
-        for i, page in enumerate(pages):
-            if not page.image:
-                continue
-            
-            # Analyze page
-            analysis = self.analyze_page(page.image)
-            
+        # Reuses the analysis from blank removal when it already ran
+        for analysis in self.analyze_pages(pages, executor):
             # If blank and landscape, rotate to portrait
             if analysis.needs_rotation:
+                i = analysis.page_index
+                page = pages[i]
                 # Rotate 90 degrees clockwise to make portrait
                 page.image = page.image.rotate(-90, expand=True)
+                analysis.is_landscape = False
+                analysis.needs_rotation = False
                 num_rotated += 1
                 
                 if self.logger:
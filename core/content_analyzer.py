@@ -72,23 +72,26 @@ class ContentAnalyzer:
         """Refine page ordering using content analysis"""
         self.logger.step("Analyzing content relationships")
         
+        # Identify pages that need content-based ordering
+        uncertain_pages = [d for d in initial_decisions if d.confidence < 0.7]
+        
+        if not uncertain_pages:
+            # Every page is confidently numbered - content can't change the order,
+            # so skip the text analysis and only settle leftover position clashes
+            self.logger.info("All pages confidently numbered - content analysis skipped")
+            return self._validate_and_adjust_ordering(initial_decisions, [])
+        
         # Extract content features
         content_features = self._extract_content_features(ocr_results)
         
         # Analyze relationships between pages
         relationships = self._analyze_content_relationships(content_features, ocr_results)
         
-        # Identify pages that need content-based ordering
-        uncertain_pages = [d for d in initial_decisions if d.confidence < 0.7]
+        self.logger.info(f"Analyzing {len(uncertain_pages)} pages with uncertain numbering")
         
-        if uncertain_pages:
-            self.logger.info(f"Analyzing {len(uncertain_pages)} pages with uncertain numbering")
-            
-            # Apply content-based refinements
-            refined_decisions = self._apply_content_refinements(
-                initial_decisions, relationships, content_features, ocr_results)
-        else:
-            refined_decisions = initial_decisions
+        # Apply content-based refinements
+        refined_decisions = self._apply_content_refinements(
+            initial_decisions, relationships, content_features, ocr_results)
         
         # Final validation and adjustment
         final_decisions = self._validate_and_adjust_ordering(refined_decisions, relationships)
@@ -21,6 +21,7 @@ class PageInfo:
         self.original_name = self.file_path.name
         self.page_number = page_number  # For multi-page documents like PDFs
         self.image = image
+        self.size_bytes = None  # Source file size, when known from the directory scan
         self.metadata = {}
         self.processing_history = []
         
@@ -88,7 +89,7 @@ class InputHandler:
         self.logger.info(f"Loaded {len(pages)} pages from {input_path}")
         return pages
     
-    def _load_single_file(self, file_path: Path) -> List[PageInfo]:
+    def _load_single_file(self, file_path: Path, size_bytes: Optional[int] = None) -> List[PageInfo]:
         """Load a single file (PDF or image)"""
         pages = []
         file_ext = file_path.suffix.lower()
@@ -98,6 +99,7 @@ class InputHandler:
         elif file_ext in self.SUPPORTED_IMAGE_FORMATS:
             page = self._load_image(file_path)
             if page:
+                page.size_bytes = size_bytes
                 pages.append(page)
         else:
             self.logger.warning(f"Unsupported file format: {file_ext}")
@@ -108,18 +110,19 @@ class InputHandler:
         """Load all supported files from directory"""
         pages = []
         
-        # Get all files and sort them naturally
-        files = []
-        for file_path in dir_path.iterdir():
-            if file_path.is_file() and self._is_supported_file(file_path):
-                files.append(file_path)
-        
-        # Sort files naturally (handle numeric sorting)
-        files.sort(key=self._natural_sort_key)
+        # Get all files and sort them naturally - one scandir pass also
+        # yields each file's size, so it isn't stat'ed again later
+        sizes = {}
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                file_path = Path(entry.path)
+                if entry.is_file() and self._is_supported_file(file_path):
+                    sizes[file_path] = entry.stat().st_size
+        files = sorted(sizes, key=self._natural_sort_key)
         
         # Load each file
         for file_path in files:
-            file_pages = self._load_single_file(file_path)
+            file_pages = self._load_single_file(file_path, sizes[file_path])
             pages.extend(file_pages)
         
         return pages
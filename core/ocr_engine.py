@@ -13,7 +13,7 @@ from typing import List, Dict, Any, Optional, Tuple
 from PIL import Image
 import tempfile
 import subprocess
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import cv2
 import numpy as np
 
@@ -44,6 +44,29 @@ class OCRResult:
     language_confidence: float
     processing_time: float
 
+# Per-process engine for process-pool OCR (see OCREngine.process_batch)
+_worker_engine = None
+
+def _init_ocr_worker(config_snapshot: Dict[str, Any], output_dir: Optional[str]):
+    """Build one OCR engine per worker process, with the parent's settings"""
+    global _worker_engine
+    # A spawned process re-reads config.json - apply this run's settings instead
+    config.config = config_snapshot
+    _worker_engine = OCREngine(None, None, output_dir)
+    # The parent merges this worker's cache index entries after the batch
+    _worker_engine.smart_cache.write_index = False
+
+def _ocr_worker_page(file_path: str, page_number: int,
+                     total_pages: int) -> Tuple[OCRResult, Dict[str, Any]]:
+    """OCR one page in a worker process
+    
+    Only the file path crosses the process boundary (OCR reads the page from
+    disk), and the result comes back without its PageInfo, together with
+    the cache index entries the page added.
+    """
+    result = _worker_engine.process_page(PageInfo(file_path, page_number), total_pages)
+    return replace(result, page_info=None), _worker_engine.smart_cache.take_pending_index_entries()
+
 class OCREngine:
     """OCR engine that works standalone without external dependencies"""
     
@@ -72,6 +95,7 @@ class OCREngine:
         self.tesseract_available = self._check_tesseract()
         
         # Initialize smart cache with output directory
+        self.output_dir = output_dir
         self.smart_cache = SmartCache(logger, output_dir)
         
         # Get OCR method from config (default: paddle)
@@ -226,17 +250,24 @@ class OCREngine:
         else:
             print(f"ERROR: {message}")
     
-    def process_batch(self, pages: List[PageInfo], workers: int = 1) -> List[OCRResult]:
+    def process_batch(self, pages: List[PageInfo], workers: int = 1,
+                      executor=None, cancel_event=None, processes: int = 0) -> List[OCRResult]:
         """Process multiple pages with OCR (supports multi-threading)
         
         Args:
             pages: List of pages to process
             workers: Number of worker threads (1 = sequential, 2+ = parallel)
+            executor: Shared ThreadPoolExecutor to run on (created per call if None)
+            cancel_event: threading.Event that stops the batch once set
+            processes: Worker processes to use instead of threads (0 = threads)
         
         Returns:
             List of OCR results
         """
-        if workers > 1:
+        if processes > 0 and len(pages) > 1:
+            return self._process_batch_in_processes(pages, processes, cancel_event)
+        
+        if workers > 1 or executor is not None:
             # Multi-threaded processing
             from concurrent.futures import ThreadPoolExecutor, as_completed
             
@@ -245,7 +276,11 @@ class OCREngine:
             
             results = [None] * len(pages)  # Pre-allocate results list
             
-            with ThreadPoolExecutor(max_workers=workers) as executor:
+            owns_executor = executor is None
+            if owns_executor:
+                executor = ThreadPoolExecutor(max_workers=workers)
+            
+            try:
                 # Submit all tasks
                 future_to_index = {
                     executor.submit(self.process_page, page, len(pages)): i 
@@ -255,10 +290,12 @@ class OCREngine:
                 # Collect results as they complete
                 completed = 0
                 for future in as_completed(future_to_index):
-                    if hasattr(self, 'cancel_processing') and self.cancel_processing:
+                    if cancel_event is not None and cancel_event.is_set():
                         if self.logger:
                             self.logger.info("OCR processing cancelled by user")
-                        executor.shutdown(wait=False, cancel_futures=True)
+                        # Only drop our own tasks - a shared pool stays alive
+                        for pending in future_to_index:
+                            pending.cancel()
                         break
                     
                     idx = future_to_index[future]
@@ -278,6 +315,9 @@ class OCREngine:
                             confidence=0.0,
                             processing_time=0.0
                         )
+            finally:
+                if owns_executor:
+                    executor.shutdown(wait=False, cancel_futures=True)
             
             return results
         
@@ -286,7 +326,7 @@ class OCREngine:
             results = []
             for i, page in enumerate(pages):
                 # Check for cancellation
-                if hasattr(self, 'cancel_processing') and self.cancel_processing:
+                if cancel_event is not None and cancel_event.is_set():
                     if self.logger:
                         self.logger.info("OCR processing cancelled by user")
                     break
@@ -297,6 +337,67 @@ class OCREngine:
                 results.append(result)
             return results
     
+    def _process_batch_in_processes(self, pages: List[PageInfo], processes: int,
+                                    cancel_event=None) -> List[OCRResult]:
+        """OCR pages in separate processes, so Python-side work isn't GIL-bound
+        
+        Each process loads its own OCR models (slow start, more RAM per worker),
+        and the number-pattern learning is per process rather than shared.
+        """
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        
+        if self.logger:
+            self.logger.info(f"⚡ Using {processes} processes for parallel OCR processing")
+        
+        results = [None] * len(pages)
+        index_entries = {}  # Workers' cache index entries, written once by this process
+        output_dir = str(self.output_dir) if self.output_dir else None
+        # spawn: forking a process that already runs Paddle/OpenCV threads is unsafe
+        executor = ProcessPoolExecutor(max_workers=processes,
+                                       mp_context=multiprocessing.get_context('spawn'),
+                                       initializer=_init_ocr_worker,
+                                       initargs=(self.config.config, output_dir))
+        try:
+            future_to_index = {
+                executor.submit(_ocr_worker_page, str(page.file_path), page.page_number, len(pages)): i
+                for i, page in enumerate(pages)
+            }
+            
+            completed = 0
+            for future in as_completed(future_to_index):
+                if cancel_event is not None and cancel_event.is_set():
+                    if self.logger:
+                        self.logger.info("OCR processing cancelled by user")
+                    break
+                
+                idx = future_to_index[future]
+                try:
+                    # Results come back without their page - rebind to this run's PageInfo
+                    result, entries = future.result()
+                    index_entries.update(entries)
+                    results[idx] = replace(result, page_info=pages[idx])
+                except Exception as e:
+                    if self.logger:
+                        self.logger.error(f"OCR failed for page {idx}: {e}")
+                    results[idx] = OCRResult(
+                        page_info=pages[idx],
+                        full_text="",
+                        detected_numbers=[],
+                        text_blocks=[],
+                        language_confidence=0.0,
+                        processing_time=0.0
+                    )
+                
+                completed += 1
+                if self.logger:
+                    self.logger.progress("OCR Processing", completed, len(pages))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.smart_cache.merge_index_entries(index_entries)
+        
+        return results
+    
     def process_page(self, page_info: PageInfo, total_pages: int = None) -> OCRResult:
         """Process a page with OCR and number detection"""
         import time
@@ -305,12 +406,16 @@ class OCREngine:
         try:
             # Check cache first (AI memory)
             # CACHE KEY: v20_adaptive - SMART adaptive upscaling (2x→3x→5x)
-            image_hash = self.smart_cache.get_image_hash(str(page_info.file_path))
+            # Keyed by file content, so unchanged pages hit even when re-extracted
+            image_hash = self.smart_cache.get_content_hash(page_info.file_path)
             cached_result = self.smart_cache.get_cached_result(image_hash, 'ocr_v20_adaptive')
             
             if cached_result:
                 if self.logger:
                     self.logger.debug(f"✨ Using cached OCR for {page_info.original_name}")
+                # Cached results are stored without their page - rebind to this run's
+                # PageInfo (later stages match OCR results to pages by identity)
+                cached_result.page_info = page_info
                 return cached_result
             
             # Load image
@@ -440,8 +545,10 @@ class OCREngine:
             
             result.processing_time = time.time() - start_time
             
-            # Save to cache for future use (AI memory) - using new cache key
-            self.smart_cache.save_result(image_hash, result, 'ocr_v20_adaptive', result.processing_time)
+            # Save to cache for future use (AI memory) - using new cache key.
+            # Drop the PageInfo so the pickle doesn't carry the full page image.
+            self.smart_cache.save_result(image_hash, replace(result, page_info=None),
+                                         'ocr_v20_adaptive', result.processing_time)
             
             return result
             
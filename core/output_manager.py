@@ -128,6 +128,7 @@ class OutputManager:
             
             # Create PDF
             pdf_canvas = canvas.Canvas(str(pdf_path), pagesize=page_size)
+            add_page_numbers = self.config.get('output.add_page_numbers', False)
             
             for i, decision in enumerate(sorted_decisions):
                 self.logger.progress("Adding pages to PDF", i + 1, len(sorted_decisions))
@@ -145,7 +146,7 @@ class OutputManager:
                                    width=page_size[0], height=page_size[1])
                 
                 # Add page number annotation if requested
-                if self.config.get('output.add_page_numbers', False):
+                if add_page_numbers:
                     pdf_canvas.setFont("Helvetica", 10)
                     pdf_canvas.drawString(20, 20, f"Page {decision.assigned_position}")
                 
@@ -258,6 +259,10 @@ class OutputManager:
             else:
                 file_prefix = self.config.get('output.file_prefix', 'page')
             
+            # Get output format from config (TIF or JPG) - same for every page
+            output_format = self.config.get('output.image_format', 'tif')
+            convert_to_300dpi = self.config.get('output.convert_to_300dpi', True)
+            
             for i, decision in enumerate(sorted_decisions):
                 self.logger.progress("Saving ordered images", i + 1, len(sorted_decisions))
                 
@@ -265,10 +270,6 @@ class OutputManager:
                 if not page_info.image:
                     continue
                 
-                # Get output format from config (TIF or JPG)
-                output_format = self.config.get('output.image_format', 'tif')
-                convert_to_300dpi = self.config.get('output.convert_to_300dpi', True)
-                
                 extension = f'.{output_format}'
                 # ★ FIX: Use sequential OUTPUT position (i+1), NOT detected page number!
                 # This ensures output files are always: 00001, 00002, 00003... (sequential)
@@ -5,6 +5,7 @@ Automatically adjusts workers, batch sizes, and settings based on available RAM
 
 import psutil
 import multiprocessing
+from functools import lru_cache
 from typing import Dict, Tuple
 
 class PerformanceOptimizer:
@@ -14,15 +15,22 @@ class PerformanceOptimizer:
         self.logger = logger
         self.cpu_count = multiprocessing.cpu_count()
         
-    def get_optimal_settings(self) -> Dict:
-        """Get optimal processing settings based on available resources"""
+    def get_optimal_settings(self, memory=None) -> Dict:
+        """Get optimal processing settings based on available resources
+        
+        Args:
+            memory: psutil.virtual_memory() snapshot to reuse (sampled if None)
+        """
         # Get system resources
-        available_ram_gb = psutil.virtual_memory().available / (1024**3)
-        total_ram_gb = psutil.virtual_memory().total / (1024**3)
+        if memory is None:
+            memory = psutil.virtual_memory()
+        available_ram_gb = memory.available / (1024**3)
+        total_ram_gb = memory.total / (1024**3)
         cpu_cores = self.cpu_count
         
-        # Determine optimal workers and batch size
-        workers, batch_size, mode = self._calculate_optimal_workers(available_ram_gb, cpu_cores)
+        # Determine optimal workers and batch size (cached per whole GB of RAM -
+        # every tier boundary is a whole GB, so bucketing never changes the result)
+        workers, batch_size, mode = self._calculate_optimal_workers(int(available_ram_gb), cpu_cores)
         
         settings = {
             'workers': workers,
@@ -43,7 +51,9 @@ class PerformanceOptimizer:
         
         return settings
     
-    def _calculate_optimal_workers(self, available_ram_gb: float, cpu_cores: int) -> Tuple[int, int, str]:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _calculate_optimal_workers(available_ram_gb: float, cpu_cores: int) -> Tuple[int, int, str]:
         """Calculate optimal number of workers based on RAM and CPU
         
         Supports extreme systems: 2GB-1TB RAM, 1-1000 CPU cores
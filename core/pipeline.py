@@ -0,0 +1,121 @@
+"""
+Page Pipeline - Streams preprocessed pages straight into OCR
+Removes the barrier between preprocessing and OCR so workers never sit idle
+"""
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, List, Optional, Tuple
+
+from .input_handler import PageInfo
+from .ocr_engine import OCRResult
+
+
+class PagePipeline:
+    """Overlapping preprocessing -> OCR pipeline
+
+    Each page is handed to OCR as soon as its preprocessing finishes,
+    instead of waiting for the whole batch. At most `workers` pages are in
+    preprocessing at once, so OCR tasks interleave with preprocessing on a
+    single pool. Numbering analysis still needs every OCR result (sequence
+    confidence is computed over all pages), so it stays a barrier after
+    the pipeline drains.
+    """
+
+    def __init__(self, preprocessor, ocr_engine, logger=None, workers: int = 1,
+                 executor: Optional[ThreadPoolExecutor] = None,
+                 is_cancelled: Optional[Callable[[], bool]] = None):
+        self.preprocessor = preprocessor
+        self.ocr_engine = ocr_engine
+        self.logger = logger
+        self.workers = max(1, workers)
+        self.executor = executor
+        self.is_cancelled = is_cancelled or (lambda: False)
+
+    def run(self, pages: List[PageInfo]) -> Tuple[List[PageInfo], List[OCRResult]]:
+        """Preprocess and OCR all pages
+
+        Returns:
+            (processed_pages, ocr_results) in the original page order
+        """
+        if self.logger:
+            self.logger.info(f"⚡ Pipelining preprocessing and OCR with {self.workers} workers")
+
+        if self.executor is not None:
+            return self._run(pages, self.executor)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return self._run(pages, executor)
+
+    def _run(self, pages: List[PageInfo], executor) -> Tuple[List[PageInfo], List[OCRResult]]:
+        total = len(pages)
+        processed_pages = list(pages)
+        ocr_results: List[Optional[OCRResult]] = [None] * total
+
+        pre_futures = {}
+        ocr_futures = {}
+        next_page = 0
+        preprocessed = 0
+        recognized = 0
+
+        # Resolve the enabled preprocessing steps once for the whole run
+        steps = self.preprocessor.get_steps()
+
+        def submit_preprocessing():
+            nonlocal next_page
+            while next_page < total and len(pre_futures) < self.workers:
+                future = executor.submit(self.preprocessor.process_page, pages[next_page], steps)
+                pre_futures[future] = next_page
+                next_page += 1
+
+        submit_preprocessing()
+        while pre_futures or ocr_futures:
+            if self.is_cancelled():
+                if self.logger:
+                    self.logger.info("Processing cancelled by user")
+                # Only drop our own tasks - a shared pool stays alive
+                for future in list(pre_futures) + list(ocr_futures):
+                    future.cancel()
+                return processed_pages, []
+
+            done, _ = wait(list(pre_futures) + list(ocr_futures), return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in pre_futures:
+                    idx = pre_futures.pop(future)
+                    try:
+                        processed_pages[idx] = future.result()
+                    except Exception as e:
+                        if self.logger:
+                            self.logger.error(f"Failed to preprocess page {idx}: {str(e)}")
+                        # Keep original page if preprocessing fails
+
+                    preprocessed += 1
+                    if self.logger:
+                        self.logger.progress("Preprocessing", preprocessed, total)
+
+                    # Hand the page to OCR right away
+                    ocr_future = executor.submit(
+                        self.ocr_engine.process_page, processed_pages[idx], total)
+                    ocr_futures[ocr_future] = idx
+                else:
+                    idx = ocr_futures.pop(future)
+                    try:
+                        ocr_results[idx] = future.result()
+                    except Exception as e:
+                        if self.logger:
+                            self.logger.error(f"OCR failed for page {idx}: {e}")
+                        ocr_results[idx] = OCRResult(
+                            page_info=processed_pages[idx],
+                            full_text="",
+                            detected_numbers=[],
+                            text_blocks=[],
+                            language_confidence=0.0,
+                            processing_time=0.0
+                        )
+
+                    recognized += 1
+                    if self.logger:
+                        self.logger.progress("OCR Processing", recognized, total)
+
+            submit_preprocessing()
+
+        return processed_pages, ocr_results
@@ -11,12 +11,29 @@ from skimage import transform, filters, morphology
 from skimage.feature import canny
 from skimage.transform import hough_line, hough_line_peaks
 import math
+from dataclasses import dataclass, fields
 
 from .input_handler import PageInfo
 from utils.config import config
 from .crop_validator import CropValidator
 from .interactive_cropper import InteractiveCropper
 
+@dataclass(frozen=True)
+class PreprocessingSteps:
+    """Enabled preprocessing steps, read from config once per batch instead of per page"""
+    auto_rotate: bool = False
+    auto_crop: bool = False
+    clean_dark_circles: bool = False
+    deskew: bool = True
+    contrast_enhance: bool = False
+    watermark_reduction: bool = False
+    
+    @classmethod
+    def from_config(cls, cfg) -> 'PreprocessingSteps':
+        """Snapshot the 'preprocessing.*' flags, using the field defaults for missing keys"""
+        return cls(**{field.name: bool(cfg.get(f'preprocessing.{field.name}', field.default))
+                      for field in fields(cls)})
+
 class Preprocessor:
     """Image preprocessing with various enhancement options"""
     
@@ -26,12 +43,15 @@ class Preprocessor:
         self.crop_validator = CropValidator(logger)
         self.interactive_cropper = InteractiveCropper(logger)
     
-    def process_batch(self, pages: List[PageInfo], workers: int = 1) -> List[PageInfo]:
+    def process_batch(self, pages: List[PageInfo], workers: int = 1,
+                      executor=None, cancel_event=None) -> List[PageInfo]:
         """Process a batch of pages with enhanced memory management (supports multi-threading)
         
         Args:
             pages: List of pages to process
             workers: Number of worker threads (1 = sequential, 2+ = parallel)
+            executor: Shared ThreadPoolExecutor to run on (created per call if None)
+            cancel_event: threading.Event that stops the batch once set
         
         Returns:
             List of processed pages
@@ -39,6 +59,9 @@ class Preprocessor:
         import gc
         import psutil
         
+        # Same steps for every page of the batch - resolve them from config once
+        steps = self.get_steps()
+        
         # Determine optimal batch size based on available memory
         available_memory_gb = psutil.virtual_memory().available / (1024**3)
         if available_memory_gb < 2:
@@ -48,7 +71,7 @@ class Preprocessor:
         else:
             memory_check_interval = 50  # Check every 50 pages if high memory
         
-        if workers > 1:
+        if workers > 1 or executor is not None:
             # Multi-threaded processing
             from concurrent.futures import ThreadPoolExecutor, as_completed
             
@@ -57,20 +80,26 @@ class Preprocessor:
             
             processed_pages = [None] * len(pages)  # Pre-allocate results list
             
-            with ThreadPoolExecutor(max_workers=workers) as executor:
+            owns_executor = executor is None
+            if owns_executor:
+                executor = ThreadPoolExecutor(max_workers=workers)
+            
+            try:
                 # Submit all tasks
                 future_to_index = {
-                    executor.submit(self.process_page, page): i 
+                    executor.submit(self.process_page, page, steps): i 
                     for i, page in enumerate(pages)
                 }
                 
                 # Collect results as they complete
                 completed = 0
                 for future in as_completed(future_to_index):
-                    if hasattr(self, 'cancel_processing') and self.cancel_processing:
+                    if cancel_event is not None and cancel_event.is_set():
                         if self.logger:
                             self.logger.info("Processing cancelled by user")
-                        executor.shutdown(wait=False, cancel_futures=True)
+                        # Only drop our own tasks - a shared pool stays alive
+                        for pending in future_to_index:
+                            pending.cancel()
                         break
                     
                     idx = future_to_index[future]
@@ -92,6 +121,9 @@ class Preprocessor:
                         if current_memory_gb < 1:
                             if self.logger:
                                 self.logger.warning(f"Low memory detected: {current_memory_gb:.1f}GB available")
+            finally:
+                if owns_executor:
+                    executor.shutdown(wait=False, cancel_futures=True)
             
             return processed_pages
         
@@ -101,14 +133,14 @@ class Preprocessor:
             
             for i, page in enumerate(pages):
                 # Check for cancellation
-                if hasattr(self, 'cancel_processing') and self.cancel_processing:
+                if cancel_event is not None and cancel_event.is_set():
                     self.logger.info("Processing cancelled by user")
                     break
                     
                 self.logger.progress("Preprocessing", i + 1, len(pages))
                 
                 try:
-                    processed_page = self.process_page(page)
+                    processed_page = self.process_page(page, steps)
                     processed_pages.append(processed_page)
                 except Exception as e:
                     self.logger.error(f"Failed to preprocess {page.original_name}: {str(e)}")
@@ -128,32 +160,42 @@ class Preprocessor:
         
         return processed_pages
     
-    def process_page(self, page: PageInfo) -> PageInfo:
-        """Process a single page with all enabled preprocessing steps"""
+    def get_steps(self) -> PreprocessingSteps:
+        """Snapshot of the currently enabled preprocessing steps"""
+        return PreprocessingSteps.from_config(self.config)
+    
+    def process_page(self, page: PageInfo, steps: Optional[PreprocessingSteps] = None) -> PageInfo:
+        """Process a single page with all enabled preprocessing steps
+        
+        Batch callers pass the steps snapshot so config isn't re-read per page.
+        """
         if not page.image:
             self.logger.warning(f"No image data for {page.original_name}")
             return page
         
-        processed_image = page.image.copy()
+        if steps is None:
+            steps = self.get_steps()
         
-        # Optimize image size for performance (maintain quality but reduce memory)
-        processed_image = self._optimize_image_size(processed_image)
+        # Convert PIL Image to numpy array for OpenCV operations - the colour
+        # conversion already makes a new array, so the page image is never copied
+        cv_image = cv2.cvtColor(np.asarray(page.image), cv2.COLOR_RGB2BGR)
         
-        # Convert PIL Image to numpy array for OpenCV operations
-        cv_image = cv2.cvtColor(np.array(processed_image), cv2.COLOR_RGB2BGR)
+        # Optimize image size for performance (maintain quality but reduce memory)
+        cv_image = self._optimize_image_size(cv_image)
         
         processing_steps = []
         rotation_angle = 0
         
         # Step 1: Auto-rotate (fix orientation)
-        if self.config.get('preprocessing.auto_rotate', False):
+        if steps.auto_rotate:
             cv_image, rotation_angle = self._auto_rotate_image(cv_image)
             if rotation_angle != 0:
                 processing_steps.append(f"auto_rotate({rotation_angle}°)")
         
         # Auto crop if enabled with validation
-        if self.config.get('preprocessing.auto_crop', False):
-            original_cv_image = cv_image.copy()
+        if steps.auto_crop:
+            # Cropping returns a view and never modifies its input
+            original_cv_image = cv_image
             cv_image = self._auto_crop_image(cv_image)
             
             # Validate crop quality
@@ -167,23 +209,23 @@ class Preprocessor:
                 processing_steps.append("auto_crop")
         
         # Clean dark circles if enabled  
-        if self.config.get('preprocessing.clean_dark_circles', False):
+        if steps.clean_dark_circles:
             cv_image = self._clean_dark_circles(cv_image)
             processing_steps.append("clean_dark_circles")
         
         # Step 3: Deskewing
-        if self.config.get('preprocessing.deskew', True):
+        if steps.deskew:
             cv_image, angle = self._deskew_image(cv_image)
             if abs(angle) > 0.5:  # Only log if significant rotation
                 processing_steps.append(f"deskew({angle:.1f}°)")
         
         # Step 3: Contrast Enhancement
-        if self.config.get('preprocessing.contrast_enhance', False):
+        if steps.contrast_enhance:
             cv_image = self._enhance_contrast(cv_image)
             processing_steps.append("contrast")
         
         # Step 4: Watermark Reduction
-        if self.config.get('preprocessing.watermark_reduction', False):
+        if steps.watermark_reduction:
             cv_image = self._reduce_watermarks(cv_image)
             processing_steps.append("watermark_reduction")
         
@@ -192,6 +234,7 @@ class Preprocessor:
         
         # Create new PageInfo with processed image
         processed_page = PageInfo(page.file_path, page.page_number, processed_image)
+        processed_page.size_bytes = page.size_bytes
         processed_page.metadata = page.metadata.copy()
         processed_page.metadata['preprocessing'] = processing_steps
         processed_page.processing_history = page.processing_history + processing_steps
@@ -209,7 +252,7 @@ class Preprocessor:
         if len(image.shape) == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
-            gray = image.copy()
+            gray = image  # Only read from, no copy needed
         
         # Detect text orientation using edge density
         # Check if image needs rotation by analyzing text direction
@@ -270,7 +313,7 @@ class Preprocessor:
         if len(image.shape) == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
-            gray = image.copy()
+            gray = image  # Only read from, no copy needed
         
         # Apply edge detection
         edges = cv2.Canny(gray, 50, 150, apertureSize=3)
@@ -345,7 +388,7 @@ class Preprocessor:
             # Convert to grayscale for watermark detection
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
-            gray = image.copy()
+            gray = image  # Only read from, no copy needed
         
         # Create mask for potential watermark areas (light/faded regions)
         _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
@@ -554,10 +597,10 @@ class Preprocessor:
             self.logger.warning(f"Clean dark circles failed: {e}")
             return cv_image if isinstance(image, np.ndarray) else image
     
-    def _optimize_image_size(self, image, max_dimension=2500):
+    def _optimize_image_size(self, image: np.ndarray, max_dimension=2500) -> np.ndarray:
         """Optimize image size for better performance while maintaining quality"""
         try:
-            width, height = image.size
+            height, width = image.shape[:2]
             # Only resize if image is very large
             if max(width, height) > max_dimension:
                 # Calculate new size maintaining aspect ratio
@@ -568,8 +611,8 @@ class Preprocessor:
                     new_height = max_dimension
                     new_width = int((width * max_dimension) / height)
                 
-                # Use high-quality resampling
-                resized_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+                # Area resampling is the high-quality choice for downscaling
+                resized_image = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_AREA)
                 
                 # Log the optimization
                 original_size = width * height
@@ -641,6 +684,7 @@ class Preprocessor:
                     
                     # Create new page with cropped image
                     cropped_page = PageInfo(page.file_path, page.page_number, cropped_image)
+                    cropped_page.size_bytes = page.size_bytes
                     cropped_page.metadata = page.metadata.copy()
                     cropped_page.metadata['manual_crop'] = True
                     cropped_page.processing_history = page.processing_history + ['manual_crop']
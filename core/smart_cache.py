@@ -6,11 +6,15 @@ Remembers processed pages and skips re-processing identical images
 import hashlib
 import pickle
 import json
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
 import os
 
+# Read size for content hashing - large enough to keep Python overhead low
+HASH_CHUNK_SIZE = 1024 * 1024
+
 class SmartCache:
     """Intelligent caching system that remembers processed images"""
     
@@ -32,6 +36,14 @@ class SmartCache:
         self.cache_index_file = self.cache_dir / "cache_index.json"
         self.cache_index = self._load_cache_index()
         
+        # OCR workers save results concurrently - index updates are serialized
+        self._index_lock = threading.Lock()
+        
+        # OCR worker processes don't write the shared index (each would overwrite
+        # the others' entries); their entries are collected here for the parent
+        self.write_index = True
+        self.pending_index_entries = {}
+        
         # Statistics
         self.hits = 0
         self.misses = 0
@@ -50,8 +62,12 @@ class SmartCache:
     def _save_cache_index(self):
         """Save cache index to disk"""
         try:
-            with open(self.cache_index_file, 'w') as f:
+            # Write then rename, so a reader never sees a half-written index
+            temp_file = self.cache_index_file.with_name(
+                f"{self.cache_index_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_file, 'w') as f:
                 json.dump(self.cache_index, f, indent=2)
+            os.replace(temp_file, self.cache_index_file)
         except Exception as e:
             if self.logger:
                 self.logger.warning(f"Failed to save cache index: {e}")
@@ -67,27 +83,43 @@ class SmartCache:
             # Fallback: hash the file path only if stat fails
             return hashlib.md5(image_path.encode()).hexdigest()
     
+    def get_content_hash(self, image_path: str) -> str:
+        """Generate a hash of the image file's bytes
+        
+        Unlike get_image_hash this survives copies, moves and re-extraction:
+        PDF pages are written to fresh temp files every run, so a path+mtime
+        key never hits for them, while their content is identical.
+        """
+        try:
+            digest = hashlib.blake2b(digest_size=16)
+            with open(image_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+            return digest.hexdigest()
+        except OSError:
+            return self.get_image_hash(str(image_path))
+    
     def get_cached_result(self, image_hash: str, result_type: str = 'ocr') -> Optional[Any]:
         """Retrieve cached result if available"""
         cache_key = f"{image_hash}_{result_type}"
+        cache_file = self.cache_dir / f"{cache_key}.pkl"
         
-        if cache_key in self.cache_index:
-            cache_file = self.cache_dir / f"{cache_key}.pkl"
-            
-            if cache_file.exists():
-                try:
-                    with open(cache_file, 'rb') as f:
-                        result = pickle.load(f)
-                    
-                    self.hits += 1
-                    
-                    if self.logger:
-                        self.logger.debug(f"✅ Cache HIT: {result_type} for {image_hash[:8]}")
-                    
-                    return result
-                except Exception as e:
-                    if self.logger:
-                        self.logger.warning(f"Failed to load cache: {e}")
+        # Entries are content-addressed, so the file alone is enough - OCR worker
+        # processes each keep their own index and don't see each other's entries
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'rb') as f:
+                    result = pickle.load(f)
+                
+                self.hits += 1
+                
+                if self.logger:
+                    self.logger.debug(f"✅ Cache HIT: {result_type} for {image_hash[:8]}")
+                
+                return result
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"Failed to load cache: {e}")
         
         self.misses += 1
         return None
@@ -98,18 +130,25 @@ class SmartCache:
         cache_file = self.cache_dir / f"{cache_key}.pkl"
         
         try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(result, f)
+            # Write then rename, so a reader never sees a half-written pickle
+            temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_file, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
             
             # Update index
-            self.cache_index[cache_key] = {
+            entry = {
                 'created': datetime.now().isoformat(),
                 'type': result_type,
                 'processing_time': processing_time,
                 'file': str(cache_file)
             }
-            
-            self._save_cache_index()
+            with self._index_lock:
+                if self.write_index:
+                    self.cache_index[cache_key] = entry
+                    self._save_cache_index()
+                else:
+                    self.pending_index_entries[cache_key] = entry
             
             if self.logger:
                 self.logger.debug(f"💾 Cached: {result_type} for {image_hash[:8]}")
@@ -118,6 +157,20 @@ class SmartCache:
             if self.logger:
                 self.logger.warning(f"Failed to save cache: {e}")
     
+    def take_pending_index_entries(self) -> Dict:
+        """Hand over the index entries collected while write_index is off"""
+        with self._index_lock:
+            entries, self.pending_index_entries = self.pending_index_entries, {}
+        return entries
+    
+    def merge_index_entries(self, entries: Dict):
+        """Add index entries saved by worker processes and write the index once"""
+        if not entries:
+            return
+        with self._index_lock:
+            self.cache_index.update(entries)
+            self._save_cache_index()
+    
     def get_statistics(self) -> Dict:
         """Get cache statistics"""
         total_requests = self.hits + self.misses
@@ -580,12 +580,7 @@ class MFPageOrganizerApp:
         if self.processing:
             self.cancel_processing = True
             # Pass cancel flag to CLI components
-            if hasattr(self.cli, 'cancel_processing'):
-                self.cli.cancel_processing = True
-            if hasattr(self.cli, 'preprocessor') and self.cli.preprocessor:
-                self.cli.preprocessor.cancel_processing = True
-            if hasattr(self.cli, 'ocr_engine') and self.cli.ocr_engine:
-                self.cli.ocr_engine.cancel_processing = True
+            self.cli.cancel()
             
             self.status_label.config(text="🚫 Cancelling...")
             self.log_message("❌ Processing cancelled by user")
@@ -1518,15 +1513,21 @@ def main():
     # Handle window closing
     def on_closing():
         if app.processing:
-            if messagebox.askokcancel("Quit", "Processing is in progress. Are you sure you want to quit?"):
-                root.destroy()
-        else:
-            root.destroy()
+            if not messagebox.askokcancel("Quit", "Processing is in progress. Are you sure you want to quit?"):
+                return
+        # The CLI keeps its worker pool between runs - release it on exit
+        if getattr(app, 'cli', None) is not None:
+            app.cli.close(wait=False)
+        root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
     root.mainloop()
 
 if __name__ == "__main__":
+    # Process-pool OCR workers re-launch the EXE - stop them here, before the GUI
+    import multiprocessing
+    multiprocessing.freeze_support()
+    
     # Simple and reliable startup - works in both script and EXE mode
     try:
         # Detect if we should show custom splash
@@ -5,52 +5,236 @@ Main entry point for the page reordering automation system.
 """
 
 import argparse
+import importlib.util
+import multiprocessing
+import os
+import re
+import stat
 import sys
-import traceback
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Optional
 
-
-# ML Training imports (optional - lazy load to avoid TensorFlow requirement)
-try:
-    from core.model_manager import get_model_manager
-    from ml_training.interactive_labeler import InteractiveLabeler
-    # QuickTrainer imports TensorFlow - load it only when needed
-    ML_AVAILABLE = True
-except ImportError:
-    ML_AVAILABLE = False
-
+# Only lightweight modules are imported at load time. The pipeline components
+# (paddle, cv2, skimage, reportlab...) are imported in setup_components, so
+# --help and argument errors never pay for them.
 try:
+    import psutil
     from utils.config import config
     from utils.logger import create_logger, ProcessLogger
-    from core.input_handler import InputHandler
-    from core.preprocessor import Preprocessor
-    from core.ocr_engine import OCREngine
-    from core.numbering_system import NumberingSystem
-    from core.content_analyzer import ContentAnalyzer
-    from core.confidence_system import ConfidenceSystem
-    from core.output_manager import OutputManager
-    from core.blank_page_detector import BlankPageDetector
-    from core.performance_optimizer import PerformanceOptimizer
-    from core.ai_learning import AILearningSystem
 except ImportError as e:
     print(f"Import error: {e}")
     print("Please ensure all dependencies are installed: pip install -r requirements.txt")
     sys.exit(1)
 
+# AI recommendation name -> config key it overrides
+AI_SETTING_CONFIG_KEYS = {
+    'preprocessing': 'default_settings.enable_preprocessing',
+    'auto_rotate': 'preprocessing.auto_rotate',
+    'auto_crop': 'preprocessing.auto_crop',
+    'clean_circles': 'preprocessing.clean_dark_circles',
+    'blank_removal': 'processing.blank_page_mode',
+    'advanced_analysis': 'ocr.use_advanced_analysis',
+}
+
+# Features recorded by AI learning: (feature name, config key, default).
+# Read per run - the AI overrides applied in stage 2 can change them.
+FEATURE_CONFIG_KEYS = (
+    ('preprocessing', 'default_settings.enable_preprocessing', True),
+    ('auto_crop', 'preprocessing.auto_crop', False),
+    ('clean_circles', 'preprocessing.clean_dark_circles', False),
+)
+
+# Running as a PyInstaller EXE (fixed for the life of the process)
+_IS_FROZEN = getattr(sys, 'frozen', False)
+
+# Startup diagnostics dependency tables: (module, display name[, required])
+_CRITICAL_DEPS = (
+    ('paddleocr', 'PaddleOCR'),
+    ('paddlex', 'PaddleX'),
+    ('paddle', 'PaddlePaddle'),  # Imports as 'paddle', not 'paddlepaddle'
+    ('cv2', 'OpenCV'),
+    ('PIL', 'Pillow'),
+    ('numpy', 'NumPy'),
+)
+_OCR_DEPS = (
+    ('einops', 'einops'),
+    ('ftfy', 'ftfy'),
+    ('imagesize', 'imagesize'),
+    ('jinja2', 'Jinja2'),
+    ('lxml', 'lxml'),
+    ('openpyxl', 'openpyxl'),
+    ('premailer', 'premailer'),
+    ('pypdfium2', 'pypdfium2'),
+    ('regex', 'regex'),
+    ('sklearn', 'scikit-learn'),
+    ('tiktoken', 'tiktoken'),
+    ('tokenizers', 'tokenizers'),
+)
+_PDF_DEPS = (
+    ('img2pdf', 'img2pdf', False),
+    ('PyPDF2', 'PyPDF2', False),
+    ('reportlab', 'reportlab', False),
+)
+_PROCESSING_DEPS = (
+    ('scipy', 'SciPy'),
+    ('yaml', 'PyYAML'),
+    ('psutil', 'psutil'),
+)
+_DIAGNOSTIC_MODULES = tuple(dep[0] for deps in (_CRITICAL_DEPS, _OCR_DEPS, _PDF_DEPS, _PROCESSING_DEPS)
+                            for dep in deps)
+
+# Image files checked when naming the output folder after the ISBN,
+# and the ISBN prefix (10+ digits before the first underscore)
+_ISBN_SOURCE_RE = re.compile(r'\.(jpe?g|png|tiff?)$', re.IGNORECASE)
+_ISBN_PREFIX_RE = re.compile(r'^(\d{10,})_')
+
+# Command line choices
+_ON_OFF_CHOICES = ('on', 'off')
+_DIAGNOSTICS_CHOICES = ('on', 'off', 'auto')
+_OUTPUT_FORMAT_CHOICES = ('pdf', 'images', 'both')
+_PRESET_CHOICES = ('quick', 'deep', 'manual')
+
+# Pipeline stage titles shown by logger.step()
+_STEP_LOAD = "STAGE 1: Loading input files"
+_STEP_OPTIMIZE = "STAGE 2: AI Optimization"
+_STEP_BLANK = "STAGE 3: Removing blank pages (mode: %s)"
+_STEP_PIPELINE = "STAGE 4: Preprocessing images (pipelined with OCR)"
+_STEP_PREPROCESS = "STAGE 4: Preprocessing images"
+_STEP_OCR = "STAGE 5: Extracting text and numbers via OCR"
+_STEP_NUMBERING = "STAGE 6: Analyzing numbering systems"
+_STEP_ORDER = "STAGE 7: Ordering pages by detected numbers"
+_STEP_CONTENT = "STAGE 8: Analyzing content relationships"
+_STEP_CONFIDENCE = "STAGE 9: Assessing ordering confidence"
+_STEP_OUTPUT = "STAGE 10-11: Generating output files (DPI conversion + Format)"
+
+# Below this many pages the size sum is cheaper to stat serially
+PARALLEL_STAT_MIN_PAGES = 100
+
+def _file_size(path) -> int:
+    """Size of a file in bytes (0 if it no longer exists)"""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+def _module_available(module: str) -> bool:
+    """Check if a module can be imported without actually importing it"""
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
+
+# ML Training modules (optional) - only located here; they are imported when
+# the model check / teaching mode actually runs. QuickTrainer needs TensorFlow.
+ML_AVAILABLE = (_module_available('core.model_manager') and
+                _module_available('ml_training.interactive_labeler'))
+
+class _ProcessingCancelled(Exception):
+    """Raised at a stage boundary once the user has cancelled"""
+
 class PageReorderCLI:
     """Command Line Interface for Page Reordering System"""
     
     def __init__(self):
         self.logger = None
         self.input_handler = None
-        self.preprocessor = None
-        self.ocr_engine = None
+        self._ai_learning = None
+        self._performance_optimizer = None
+        self._preprocessor = None
+        self._ocr_engine = None
+        self._blank_page_detector = None
+        self._output_dir = None
         self.numbering_system = None
         self.content_analyzer = None
         self.confidence_system = None
         self.output_manager = None
         self.model_manager = None
+        self.thread_pool = None
+        self.thread_pool_workers = 0
+        self.cancel_event = threading.Event()
+    
+    # Heavy components are built on first use, so stages that never run
+    # (e.g. preprocessing disabled) never pay their model/engine setup
+    @property
+    def ai_learning(self):
+        if self._ai_learning is None:
+            from core.ai_learning import AILearningSystem
+            self._ai_learning = AILearningSystem(self.logger)
+        return self._ai_learning
+    
+    @property
+    def performance_optimizer(self):
+        if self._performance_optimizer is None:
+            from core.performance_optimizer import PerformanceOptimizer
+            self._performance_optimizer = PerformanceOptimizer(self.logger)
+        return self._performance_optimizer
+    
+    @property
+    def preprocessor(self):
+        if self._preprocessor is None:
+            from core.preprocessor import Preprocessor
+            self._preprocessor = Preprocessor(self.logger)
+        return self._preprocessor
+    
+    @property
+    def ocr_engine(self):
+        if self._ocr_engine is None:
+            from core.ocr_engine import OCREngine
+            self._ocr_engine = OCREngine(self.logger, self.ai_learning, self._output_dir)  # Pass output dir for cache
+        return self._ocr_engine
+    
+    @property
+    def blank_page_detector(self):
+        if self._blank_page_detector is None:
+            from core.blank_page_detector import BlankPageDetector
+            self._blank_page_detector = BlankPageDetector(self.logger)
+        return self._blank_page_detector
+    
+    def cancel(self):
+        """Request cancellation of the running process"""
+        # The event is handed to the batch stages, so they stop after the
+        # current page instead of finishing the whole batch first
+        self.cancel_event.set()
+    
+    @property
+    def cancel_processing(self) -> bool:
+        return self.cancel_event.is_set()
+    
+    @contextmanager
+    def _step(self, title: str):
+        """Start a pipeline stage - stops the run first if cancel was requested"""
+        if self.cancel_event.is_set():
+            raise _ProcessingCancelled("cancelled by user")
+        self.logger.flush()  # Write out the previous stage's buffered file records
+        self.logger.step(title)
+        yield
+    
+    def _get_thread_pool(self, workers: int) -> ThreadPoolExecutor:
+        """Get the worker pool shared by all parallel stages"""
+        if self.thread_pool is not None and self.thread_pool_workers != workers:
+            self.thread_pool.shutdown(wait=True)
+            self.thread_pool = None
+        if self.thread_pool is None:
+            self.thread_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='mfpage')
+            self.thread_pool_workers = workers
+        return self.thread_pool
+    
+    def close(self, wait: bool = True):
+        """Release the shared worker pool
+        
+        The pool outlives a single run() so repeated runs from the GUI keep
+        their warm worker threads (and the per-thread state OCR builds in them).
+        """
+        if self.thread_pool is not None:
+            self.thread_pool.shutdown(wait=wait)
+            self.thread_pool = None
     
     def setup_components(self, args, output_dir=None):
         """Initialize all system components"""
@@ -66,27 +250,42 @@ class PageReorderCLI:
         # ═══════════════════════════════════════════════════════════
         # STARTUP DIAGNOSTICS - Check everything before processing
         # ═══════════════════════════════════════════════════════════
-        self._run_startup_diagnostics()
+        # 'auto' only runs them for the packaged EXE (or when a deep check is
+        # asked for) - script runs during development skip the probing
+        deep_diagnostics = getattr(args, 'deep_diagnostics', False)
+        diagnostics_mode = getattr(args, 'diagnostics', 'auto')
+        if diagnostics_mode == 'on' or (diagnostics_mode == 'auto' and (_IS_FROZEN or deep_diagnostics)):
+            self._run_startup_diagnostics(deep=deep_diagnostics)
         
-        # Initialize AI learning system FIRST (for adaptive behavior)
-        self.ai_learning = AILearningSystem(self.logger)
+        from core.input_handler import InputHandler
+        from core.numbering_system import NumberingSystem
+        from core.content_analyzer import ContentAnalyzer
+        from core.confidence_system import ConfidenceSystem
+        from core.output_manager import OutputManager
         
-        self.performance_optimizer = PerformanceOptimizer(self.logger)
         self.input_handler = InputHandler(self.logger)  # FIXED: Missing input handler
-        self.preprocessor = Preprocessor(self.logger)   # FIXED: Missing preprocessor 
-        self.ocr_engine = OCREngine(self.logger, self.ai_learning, output_dir)  # IMPROVED: Pass output dir for cache
+        # Performance optimizer, preprocessor, OCR engine and blank page
+        # detector are built lazily (with this run's logger). AI learning is
+        # kept across runs so its data file is read once, not every run.
+        if self._ai_learning is not None:
+            self._ai_learning.logger = self.logger
+        self._performance_optimizer = None
+        self._preprocessor = None
+        self._ocr_engine = None
+        self._blank_page_detector = None
+        self._output_dir = output_dir
         self.numbering_system = NumberingSystem(self.logger)
         self.content_analyzer = ContentAnalyzer(self.logger)
         self.confidence_system = ConfidenceSystem(self.logger)
         self.output_manager = OutputManager(self.logger)
-        self.blank_page_detector = BlankPageDetector(self.logger)
-        self.cancel_processing = False
+        self.cancel_event.clear()
         
         # ═══════════════════════════════════════════════════════════
         # ML MODEL CHECK - Prompt user about teaching if no model
         # ═══════════════════════════════════════════════════════════
         if ML_AVAILABLE and not getattr(args, 'skip_ml_prompt', False):
             try:
+                from core.model_manager import get_model_manager
                 self.model_manager = get_model_manager()
                 
                 if not self.model_manager.model_exists():
@@ -100,231 +299,251 @@ class PageReorderCLI:
                     self.logger.debug(f"ML model check failed: {e}")
                 pass  # ML not critical
     
-    def process_pages(self, input_path: str, output_path: str) -> bool:
-        """Main processing pipeline"""
+    def process_pages(self, input_path: Path, output_path: Path,
+                      input_is_dir: Optional[bool] = None) -> bool:
+        """Main processing pipeline
+        
+        Args:
+            input_path: Folder of images or a single PDF/image file
+            output_path: Folder for the reordered output
+            input_is_dir: Known input type from run()'s stat (checked here if None)
+        """
+        log = self.logger  # bound once - used at every stage boundary below
         try:
             # Get folder name for PDF naming
-            input_path_obj = Path(input_path)
-            if input_path_obj.is_dir():
-                folder_name = input_path_obj.name
+            if input_is_dir is None:
+                input_is_dir = input_path.is_dir()
+            if input_is_dir:
+                folder_name = input_path.name
             else:
-                folder_name = input_path_obj.stem
+                folder_name = input_path.stem
             
-            import time
             start_time = time.time()
             
-            with ProcessLogger(self.logger, "Page Reordering Process"):
+            with ProcessLogger(log, "Page Reordering Process"):
                 
                 # ═══════════════════════════════════════════════════════════
                 # STAGE 1: LOAD INPUT FILES
                 # ═══════════════════════════════════════════════════════════
-                self.logger.step("STAGE 1: Loading input files")
-                pages = self.input_handler.load_files(input_path)
+                with self._step(_STEP_LOAD):
+                    pages = self.input_handler.load_files(input_path)
                 if not pages:
-                    self.logger.failure("No valid pages found in input")
+                    log.failure("No valid pages found in input")
                     return False
                 
-                self.logger.info(f"✅ Stage 1 Complete: Loaded {len(pages)} pages")
+                log.info("✅ Stage 1 Complete: Loaded %d pages", len(pages))
                 
                 # ═══════════════════════════════════════════════════════════
                 # STAGE 2: AI OPTIMIZATION
                 # ═══════════════════════════════════════════════════════════
-                self.logger.step("STAGE 2: AI Optimization")
-                import psutil
-                available_ram_gb = psutil.virtual_memory().available / (1024**3)
-                
-                # Get AI recommendations based on document size and system resources
-                ai_recommendations = self.ai_learning.get_recommended_settings(
-                    len(pages), available_ram_gb)
-                
-                # Apply AI recommendations to config
-                self.logger.info("🤖 Applying AI-optimized settings...")
-                for setting, value in ai_recommendations.items():
-                    if setting != 'reasoning':
-                        if setting == 'preprocessing':
-                            config.set('default_settings.enable_preprocessing', value)
-                        elif setting == 'auto_rotate':
-                            config.set('preprocessing.auto_rotate', value)
-                        elif setting == 'auto_crop':
-                            config.set('preprocessing.auto_crop', value)
-                        elif setting == 'clean_circles':
-                            config.set('preprocessing.clean_dark_circles', value)
-                        elif setting == 'blank_removal':
-                            config.set('processing.blank_page_mode', value)
-                        elif setting == 'advanced_analysis':
-                            config.set('ocr.use_advanced_analysis', value)
-                
-                # Show AI reasoning
-                for reason in ai_recommendations.get('reasoning', []):
-                    self.logger.info(f"   • {reason}")
-                
-                # Get optimization suggestions
-                suggestions = self.ai_learning.suggest_optimization(len(pages), available_ram_gb)
-                for suggestion in suggestions:
-                    self.logger.info(suggestion)
-                
-                # Get optimal performance settings based on AI + system resources
-                perf_settings = self.performance_optimizer.get_optimal_settings()
-                workers = perf_settings['workers']
-                
-                self.logger.info("=" * 70)
-                self.logger.info(f"🎯 SYSTEM OPTIMIZATION:")
-                self.logger.info(f"  CPU Cores: {perf_settings['cpu_cores']}")
-                self.logger.info(f"  Available RAM: {perf_settings['available_ram_gb']:.1f}GB / {perf_settings['total_ram_gb']:.1f}GB")
-                self.logger.info(f"  Performance Mode: {perf_settings['mode']}")
-                self.logger.info(f"  Worker Threads: {workers}")
-                self.logger.info(f"  Batch Size: {perf_settings['batch_size']}")
-                self.logger.info("=" * 70)
-                
-                # Estimate processing time with AI predictions
-                features_enabled = {
-                    'preprocessing': config.get('default_settings.enable_preprocessing', False),
-                    'auto_crop': config.get('preprocessing.auto_crop', False),
-                    'clean_circles': config.get('preprocessing.clean_dark_circles', False)
-                }
-                estimated_time = self.ai_learning.predict_processing_time(len(pages), features_enabled)
-                # Adjust estimate based on workers
-                estimated_time_parallel = estimated_time / max(1, workers * 0.7)  # 70% efficiency factor
-                self.logger.info(f"⏱️ AI estimated time (sequential): {estimated_time:.1f} minutes")
-                self.logger.info(f"⏱️ Estimated time ({workers} workers): {estimated_time_parallel:.1f} minutes")
-                self.logger.info(f"✅ Stage 2 Complete: AI optimization applied")
+                with self._step(_STEP_OPTIMIZE):
+                    # One memory sample shared by the AI recommendations and the optimizer
+                    memory = psutil.virtual_memory()
+                    available_ram_gb = memory.available / (1024**3)
+                    
+                    # Get AI recommendations based on document size and system resources
+                    ai_recommendations = self.ai_learning.get_recommended_settings(
+                        len(pages), available_ram_gb)
+                    
+                    # Apply AI recommendations to config
+                    log.info("🤖 Applying AI-optimized settings...")
+                    ai_overrides = {}
+                    for setting, value in ai_recommendations.items():
+                        config_key = AI_SETTING_CONFIG_KEYS.get(setting)
+                        if config_key:
+                            ai_overrides[config_key] = value
+                        elif setting != 'reasoning':
+                            log.debug(f"AI setting '{setting}' has no config mapping - not applied")
+                    config.update(ai_overrides)
+                    
+                    # Snapshot the settings this run uses - read once, after the AI overrides.
+                    # features_enabled drives the stages AND is what AI learning records.
+                    features_enabled = {feature: config.get(key, default)
+                                        for feature, key, default in FEATURE_CONFIG_KEYS}
+                    interactive_crop = config.get('preprocessing.interactive_crop', False)
+                    blank_mode = config.get('processing.blank_page_mode', 'start_end')
+                    rotate_blank_portrait = config.get('processing.rotate_blank_to_portrait', True)
+                    min_confidence = config.get('content_analysis.min_confidence_for_auto_order', 90)
+                    # Opt-in: OCR in worker processes (each loads its own models)
+                    ocr_processes = config.get('ocr.process_workers', 0)
+                    
+                    # Show AI reasoning (one record per block, not per line)
+                    reasoning = ai_recommendations.get('reasoning', [])
+                    if reasoning:
+                        log.info("\n".join(f"   • {reason}" for reason in reasoning))
+                    
+                    # Get optimization suggestions
+                    suggestions = self.ai_learning.suggest_optimization(len(pages), available_ram_gb)
+                    if suggestions:
+                        log.info("\n".join(suggestions))
+                    
+                    # Get optimal performance settings based on AI + system resources
+                    perf_settings = self.performance_optimizer.get_optimal_settings(memory)
+                    workers = perf_settings['workers']
+                    
+                    # One pool for every parallel stage instead of one per process_batch
+                    executor = self._get_thread_pool(workers) if workers > 1 else None
+                    
+                    # One record for the whole banner - no interleaving with worker logs
+                    log.info("\n".join([
+                        "=" * 70,
+                        "🎯 SYSTEM OPTIMIZATION:",
+                        f"  CPU Cores: {perf_settings['cpu_cores']}",
+                        f"  Available RAM: {perf_settings['available_ram_gb']:.1f}GB / {perf_settings['total_ram_gb']:.1f}GB",
+                        f"  Performance Mode: {perf_settings['mode']}",
+                        f"  Worker Threads: {workers}",
+                        f"  Batch Size: {perf_settings['batch_size']}",
+                        "=" * 70,
+                    ]))
+                    
+                    # Estimate processing time with AI predictions
+                    estimated_time = self.ai_learning.predict_processing_time(len(pages), features_enabled)
+                    # Adjust estimate based on workers
+                    estimated_time_parallel = estimated_time / max(1, workers * 0.7)  # 70% efficiency factor
+                    log.info("⏱️ AI estimated time (sequential): %.1f minutes", estimated_time)
+                    log.info("⏱️ Estimated time (%d workers): %.1f minutes", workers, estimated_time_parallel)
+                log.info(f"✅ Stage 2 Complete: AI optimization applied")
                 
                 # ═══════════════════════════════════════════════════════════
                 # STAGE 3: BLANK PAGE REMOVAL
                 # ═══════════════════════════════════════════════════════════
-                blank_mode = config.get('processing.blank_page_mode', 'start_end')
                 if blank_mode != 'none':
-                    self.logger.step(f"STAGE 3: Removing blank pages (mode: {blank_mode})")
-                    pages, num_removed = self.blank_page_detector.remove_blank_pages(pages, blank_mode)
-                    if num_removed > 0:
-                        self.logger.info(f"Removed {num_removed} blank pages")
-                        self.logger.info(f"Remaining pages: {len(pages)}")
+                    with self._step(_STEP_BLANK % blank_mode):
+                        pages, num_removed = self.blank_page_detector.remove_blank_pages(
+                            pages, blank_mode, executor)
+                        if num_removed > 0:
+                            log.info("Removed %d blank pages", num_removed)
+                            log.info("Remaining pages: %d", len(pages))
                 
                 # STAGE 3B: BLANK PAGE ORIENTATION FIX (Portrait)
                 # Rotate blank landscape pages to portrait (default orientation)
-                rotate_blank_portrait = config.get('processing.rotate_blank_to_portrait', True)
                 if rotate_blank_portrait:
-                    self.logger.info(f"🔄 Checking blank page orientation...")
-                    pages, num_rotated = self.blank_page_detector.rotate_blank_landscape_to_portrait(pages)
+                    log.info(f"🔄 Checking blank page orientation...")
+                    pages, num_rotated = self.blank_page_detector.rotate_blank_landscape_to_portrait(
+                        pages, executor)
                     if num_rotated > 0:
-                        self.logger.info(f"📄 Rotated {num_rotated} blank landscape pages to portrait")
+                        log.info("📄 Rotated %d blank landscape pages to portrait", num_rotated)
                 
-                self.logger.info(f"✅ Stage 3 Complete: Blank page processing done")
+                log.info(f"✅ Stage 3 Complete: Blank page processing done")
                 
                 # ═══════════════════════════════════════════════════════════
                 # STAGE 4: PREPROCESSING
                 # ═══════════════════════════════════════════════════════════
-                if config.get('default_settings.enable_preprocessing', True):
-                    # Check for cancellation
-                    if self.cancel_processing:
-                        self.logger.info("Processing cancelled by user")
-                        return False
-                        
-                    self.logger.step("STAGE 4: Preprocessing images")
-                    pages = self.preprocessor.process_batch(pages, workers=workers)
+                ocr_results = None
+                if features_enabled['preprocessing']:
+                    # Stream pages into OCR as they finish preprocessing
+                    # (manual cropping needs every page before OCR starts)
+                    if workers > 1 and not interactive_crop and not ocr_processes:
+                        with self._step(_STEP_PIPELINE):
+                            from core.pipeline import PagePipeline
+                            pipeline = PagePipeline(self.preprocessor, self.ocr_engine, self.logger,
+                                                    workers=workers, executor=executor,
+                                                    is_cancelled=self.cancel_event.is_set)
+                            pages, ocr_results = pipeline.run(pages)
+                    else:
+                        with self._step(_STEP_PREPROCESS):
+                            pages = self.preprocessor.process_batch(
+                                pages, workers=workers, executor=executor, cancel_event=self.cancel_event)
                 
                 # Generate crop validation report if auto-crop was used
-                if config.get('preprocessing.auto_crop', False):
-                    crop_report = self.preprocessor.generate_crop_reports(Path(output_path))
+                if features_enabled['auto_crop']:
+                    crop_report = self.preprocessor.generate_crop_reports(output_path)
                     if crop_report:
-                        self.logger.info(f"📋 Crop review report: {crop_report}")
+                        log.info("📋 Crop review report: %s", crop_report)
                     
                     # Handle interactive manual cropping if enabled
-                    if config.get('preprocessing.interactive_crop', False):
+                    if interactive_crop:
                         pages = self.preprocessor.handle_manual_cropping(pages)
                         if pages is None:
                             # User cancelled during manual cropping
-                            self.logger.info("Processing cancelled during manual cropping")
+                            log.info("Processing cancelled during manual cropping")
                             return False
                 
-                self.logger.info(f"✅ Stage 4 Complete: Preprocessing done")
+                log.info(f"✅ Stage 4 Complete: Preprocessing done")
                 
                 # ═══════════════════════════════════════════════════════════
                 # STAGE 5: OCR & PAGE DETECTION
                 # ═══════════════════════════════════════════════════════════
-                if self.cancel_processing:
-                    self.logger.info("Processing cancelled by user")
-                    return False
-                    
-                self.logger.step("STAGE 5: Extracting text and numbers via OCR")
-                ocr_results = self.ocr_engine.process_batch(pages, workers=workers)
-                self.logger.info(f"✅ Stage 5 Complete: OCR processing done")
+                if ocr_results is None:
+                    with self._step(_STEP_OCR):
+                        ocr_results = self.ocr_engine.process_batch(
+                            pages, workers=workers, executor=executor, cancel_event=self.cancel_event,
+                            processes=ocr_processes)
+                log.info(f"✅ Stage 5 Complete: OCR processing done")
                 
                 # ═══════════════════════════════════════════════════════════
                 # STAGE 6: NUMBERING ANALYSIS
                 # ═══════════════════════════════════════════════════════════
-                if self.cancel_processing:
-                    self.logger.info("Processing cancelled by user")
-                    return False
-                    
-                self.logger.step("STAGE 6: Analyzing numbering systems")
-                numbering_info = self.numbering_system.analyze_numbering(ocr_results)
-                self.logger.info(f"✅ Stage 6 Complete: Numbering analysis done")
+                with self._step(_STEP_NUMBERING):
+                    numbering_info = self.numbering_system.analyze_numbering(ocr_results)
+                log.info(f"✅ Stage 6 Complete: Numbering analysis done")
                 
                 # ═══════════════════════════════════════════════════════════
                 # STAGE 7: PAGE ORDERING
                 # ═══════════════════════════════════════════════════════════
-                if self.cancel_processing:
-                    self.logger.info("Processing cancelled by user")
-                    return False
-                    
-                self.logger.step("STAGE 7: Ordering pages by detected numbers")
-                ordered_pages = self.numbering_system.order_by_numbers(pages, ocr_results, numbering_info)
-                self.logger.info(f"✅ Stage 7 Complete: Page ordering done")
+                with self._step(_STEP_ORDER):
+                    ordered_pages = self.numbering_system.order_by_numbers(pages, ocr_results, numbering_info)
+                log.info(f"✅ Stage 7 Complete: Page ordering done")
                 
                 # ═══════════════════════════════════════════════════════════
                 # STAGE 8: CONTENT ANALYSIS
                 # ═══════════════════════════════════════════════════════════
-                if self.cancel_processing:
-                    self.logger.info("Processing cancelled by user")
-                    return False
-                    
-                self.logger.step("STAGE 8: Analyzing content relationships")
-                final_order = self.content_analyzer.refine_ordering(ordered_pages, ocr_results)
-                self.logger.info(f"✅ Stage 8 Complete: Content analysis done")
+                with self._step(_STEP_CONTENT):
+                    final_order = self.content_analyzer.refine_ordering(ordered_pages, ocr_results)
+                log.info(f"✅ Stage 8 Complete: Content analysis done")
                 
                 # ═══════════════════════════════════════════════════════════
                 # STAGE 9: CONFIDENCE ASSESSMENT
                 # ═══════════════════════════════════════════════════════════
-                self.logger.step("STAGE 9: Assessing ordering confidence")
-                confidence_report = self.confidence_system.evaluate_ordering(final_order, ocr_results)
-                self.logger.info(f"✅ Stage 9 Complete: Confidence assessment done")
+                with self._step(_STEP_CONFIDENCE):
+                    confidence_report = self.confidence_system.evaluate_ordering(final_order, ocr_results)
+                log.info(f"✅ Stage 9 Complete: Confidence assessment done")
                 
                 # Handle low-confidence cases
-                if config.get('content_analysis.min_confidence_for_auto_order', 90) > confidence_report['overall_confidence']:
-                    self.logger.warning(f"Low confidence ordering ({confidence_report['overall_confidence']:.1f}%)")
-                    self.logger.info("Consider using GUI mode for manual review")
+                if min_confidence > confidence_report['overall_confidence']:
+                    log.warning("Low confidence ordering (%.1f%%)", confidence_report['overall_confidence'])
+                    log.info("Consider using GUI mode for manual review")
                 
                 # ═══════════════════════════════════════════════════════════
                 # STAGE 10 & 11: OUTPUT GENERATION (DPI + Format)
                 # ═══════════════════════════════════════════════════════════
-                self.logger.step("STAGE 10-11: Generating output files (DPI conversion + Format)")
-                success = self.output_manager.create_output(
-                    final_order, 
-                    output_path, 
-                    confidence_report,
-                    ocr_results,
-                    folder_name  # Pass folder name for PDF naming
-                )
+                with self._step(_STEP_OUTPUT):
+                    success = self.output_manager.create_output(
+                        final_order, 
+                        output_path, 
+                        confidence_report,
+                        ocr_results,
+                        folder_name  # Pass folder name for PDF naming
+                    )
                 
                 if success:
-                    self.logger.info(f"✅ Stage 10-11 Complete: Output generation done")
-                    self.logger.success(f"Successfully processed {len(final_order)} pages")
-                    self.logger.info(f"Output saved to: {output_path}")
+                    log.info(f"✅ Stage 10-11 Complete: Output generation done")
+                    log.success(f"Successfully processed {len(final_order)} pages")
+                    log.info("Output saved to: %s", output_path)
                     
                     # Show AI Learning Statistics (SPEED IMPROVEMENTS!)
                     if hasattr(self.ocr_engine, 'advanced_detector'):
-                        self.logger.info("")
+                        log.info("")
                         self.ocr_engine.advanced_detector.log_learning_stats()
                     
                     # Record processing session for AI learning
-                    import time
-                    processing_time = time.time() - start_time if 'start_time' in locals() else 0
+                    processing_time = time.time() - start_time
+                    
+                    # Folder scans already know each file's size; only pages
+                    # without one (PDF extracts) are stat'ed. Large batches are
+                    # stat'ed on the worker pool - each stat is a round-trip on
+                    # network shares (SMB/NFS scan folders)
+                    total_bytes = sum(p.size_bytes for p in pages if p.size_bytes is not None)
+                    page_paths = [p.file_path for p in pages if p.size_bytes is None]
+                    if executor is not None and len(page_paths) > PARALLEL_STAT_MIN_PAGES:
+                        total_bytes += sum(executor.map(_file_size, page_paths))
+                    else:
+                        total_bytes += sum(map(_file_size, page_paths))
                     
                     document_info = {
                         'page_count': len(pages),
                         'file_type': 'images',
-                        'size_mb': sum(p.file_path.stat().st_size for p in pages if p.file_path.exists()) / (1024*1024)
+                        'size_mb': total_bytes / (1024*1024)
                     }
                     
                     result_info = {
@@ -339,55 +558,61 @@ class PageReorderCLI:
                     
                     return True  # Return success
                 else:
-                    self.logger.failure("Failed to generate output")
+                    log.failure("Failed to generate output")
                     return False
                     
+        except _ProcessingCancelled:
+            log.info("Processing cancelled by user")
+            return False
         except Exception as e:
-            self.logger.error(f"Processing failed: {str(e)}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            import traceback  # Only needed on the error path
+            log.error(f"Processing failed: {str(e)}")
+            log.error(traceback.format_exc())
             return False
     
     
     def run(self, args):
         """Run the page reordering process with given arguments"""
         try:            
-            # Validate input path
+            # Validate input path - one stat answers both "exists" and "is a folder"
             input_path = Path(args.input)
-            if not input_path.exists():
+            try:
+                input_is_dir = stat.S_ISDIR(os.stat(input_path).st_mode)
+            except OSError:
                 self.logger.failure(f"Input path does not exist: {input_path}")
                 return False
             
             # Setup output path
             if args.output:
                 output_path = Path(args.output)
-                output_path.mkdir(parents=True, exist_ok=True)
             else:
                 # Create output folder INSIDE input folder
-                if input_path.is_dir():
+                if input_is_dir:
                     # Extract ISBN from first image file in folder
-                    image_files = list(input_path.glob('*.jpg')) + list(input_path.glob('*.png')) + list(input_path.glob('*.tif')) + list(input_path.glob('*.tiff'))
-                    if image_files:
-                        first_file = image_files[0].name
-                        # Extract ISBN (numbers before first underscore)
-                        parts = first_file.split('_')
-                        if parts and parts[0].isdigit() and len(parts[0]) >= 10:
-                            isbn = parts[0]  # Use ISBN as folder name
-                        else:
-                            isbn = "Organized_Pages"  # Default name
+                    # (single directory pass that stops at the first image)
+                    first_file = None
+                    with os.scandir(input_path) as entries:
+                        for entry in entries:
+                            # Name check first - is_file() may need a stat call
+                            if _ISBN_SOURCE_RE.search(entry.name) and entry.is_file():
+                                first_file = entry.name
+                                break
+                    # Extract ISBN (numbers before first underscore)
+                    isbn_match = _ISBN_PREFIX_RE.match(first_file) if first_file else None
+                    if isbn_match:
+                        isbn = isbn_match.group(1)  # Use ISBN as folder name
                     else:
-                        isbn = "Organized_Pages"
+                        isbn = "Organized_Pages"  # Default name
                     
                     # Create output INSIDE the input folder
                     output_path = input_path / isbn
-                    output_path.mkdir(parents=True, exist_ok=True)
                 else:
                     # For single file, use parent folder
                     output_path = input_path.parent / "reordered"
-                    output_path.mkdir(parents=True, exist_ok=True)
+            os.makedirs(output_path, exist_ok=True)
             
             # Setup components with output directory for cache
-            self.setup_components(args, str(output_path))
+            self.setup_components(args, output_path)
             
             self.logger.info("🚀 AI Page Reordering Automation System")
             self.logger.info(f"Input: {input_path}")
@@ -395,7 +620,7 @@ class PageReorderCLI:
             self.logger.info(f"Configuration: {config.config_path}")
             
             # Process pages
-            success = self.process_pages(str(input_path), str(output_path))
+            success = self.process_pages(input_path, output_path, input_is_dir)
             
             if success:
                 self.logger.success("✨ Page reordering completed successfully!")
@@ -405,10 +630,15 @@ class PageReorderCLI:
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Processing failed: {str(e)}")
             import traceback
+            self.logger.error(f"Processing failed: {str(e)}")
             self.logger.error(traceback.format_exc())
             return False
+        finally:
+            # File records are buffered - the GUI keeps running, so write this
+            # run's tail (output stages, final result) out now
+            if self.logger:
+                self.logger.flush()
     
     def _prompt_ml_teaching(self):
         """Prompt user about ML teaching in CLI mode"""
@@ -477,6 +707,7 @@ class PageReorderCLI:
         print()
         
         try:
+            from ml_training.interactive_labeler import InteractiveLabeler
             labeler = InteractiveLabeler(sample_folder)
             labeler.run()  # Opens GUI window for labeling
             
@@ -529,195 +760,186 @@ class PageReorderCLI:
             if self.logger:
                 self.logger.error(f"ML teaching failed: {e}")
     
-    def _run_startup_diagnostics(self):
-        """Run comprehensive startup diagnostics - checks ALL dependencies"""
-        import os
+    def _run_startup_diagnostics(self, deep: bool = False):
+        """Run comprehensive startup diagnostics - checks ALL dependencies
         
-        self.logger.info("=" * 70)
-        self.logger.info("🔍 COMPREHENSIVE STARTUP DIAGNOSTICS")
-        self.logger.info("=" * 70)
+        Args:
+            deep: Actually import PaddleOCR/paddlex to test initialization
+                  (always done in EXE mode, where the paddlex patch is checked)
+        """
+        # Lines are buffered and written once per section instead of one
+        # handler call (timestamp, lock, flush) per line
+        report = []
+        
+        def flush():
+            # One record per run of same-level lines keeps errors at error level
+            for level, group in groupby(report, key=itemgetter(0)):
+                getattr(self.logger, level)("\n".join(line for _, line in group))
+            report.clear()
+        
+        report.append(('info', "=" * 70))
+        report.append(('info', "🔍 COMPREHENSIVE STARTUP DIAGNOSTICS"))
+        report.append(('info', "=" * 70))
         
         errors = []
         warnings = []
         
         # Check 1: Python version
         python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
-        self.logger.info(f"✓ Python Version: {python_version}")
+        report.append(('info', f"✓ Python Version: {python_version}"))
         
         # Check 2: Running mode (Script vs EXE)
-        is_frozen = getattr(sys, 'frozen', False)
-        if is_frozen:
-            self.logger.info(f"✓ Running Mode: EXE (Standalone)")
+        if _IS_FROZEN:
+            report.append(('info', f"✓ Running Mode: EXE (Standalone)"))
             base_path = sys._MEIPASS
-            self.logger.info(f"  Base Path: {base_path}")
+            report.append(('info', f"  Base Path: {base_path}"))
         else:
-            self.logger.info(f"✓ Running Mode: Script")
+            report.append(('info', f"✓ Running Mode: Script"))
         
         # Check 3: PaddleX models
-        if is_frozen:
+        if _IS_FROZEN:
             paddlex_path = os.path.join(sys._MEIPASS, '.paddlex')
             if os.path.exists(paddlex_path):
                 model_count = len([f for f in Path(paddlex_path).rglob('*') if f.is_file()])
-                self.logger.info(f"✓ PaddleX Models: Found ({model_count} files)")
-                self.logger.info(f"  Location: {paddlex_path}")
+                report.append(('info', f"✓ PaddleX Models: Found ({model_count} files)"))
+                report.append(('info', f"  Location: {paddlex_path}"))
                 
                 # Check for specific models
                 models_dir = Path(paddlex_path) / 'official_models'
                 if models_dir.exists():
                     models = [d.name for d in models_dir.iterdir() if d.is_dir()]
-                    self.logger.info(f"  Models: {', '.join(models[:3])}...")
+                    report.append(('info', f"  Models: {', '.join(models[:3])}..."))
                 else:
                     warnings.append("official_models directory not found")
             else:
                 errors.append("PaddleX Models NOT FOUND - PaddleOCR will fail!")
-                self.logger.error(f"❌ PaddleX Models: NOT FOUND")
-                self.logger.error(f"  Expected: {paddlex_path}")
+                report.append(('error', f"❌ PaddleX Models: NOT FOUND"))
+                report.append(('error', f"  Expected: {paddlex_path}"))
         else:
             # Script mode - check user directory
             paddlex_path = Path.home() / '.paddlex'
             if paddlex_path.exists():
                 model_count = len([f for f in paddlex_path.rglob('*') if f.is_file()])
-                self.logger.info(f"✓ PaddleX Models: Found ({model_count} files)")
+                report.append(('info', f"✓ PaddleX Models: Found ({model_count} files)"))
             else:
                 warnings.append("PaddleX Models not downloaded yet")
         
-        self.logger.info("")
-        self.logger.info("📦 CHECKING CRITICAL DEPENDENCIES:")
-        self.logger.info("-" * 70)
+        flush()
+        report.append(('info', ""))
+        report.append(('info', "📦 CHECKING CRITICAL DEPENDENCIES:"))
+        report.append(('info', "-" * 70))
         
         # Check 4: Core image processing libraries
-        critical_deps = {
-            'paddleocr': 'PaddleOCR',
-            'paddlex': 'PaddleX',
-            'paddle': 'PaddlePaddle',  # Imports as 'paddle', not 'paddlepaddle'
-            'cv2': 'OpenCV',
-            'PIL': 'Pillow',
-            'numpy': 'NumPy',
-        }
-        
-        for module, name in critical_deps.items():
-            try:
-                __import__(module)
-                self.logger.info(f"✓ {name}")
-            except ImportError as e:
+        # find_spec only locates the module - heavy imports (paddle, cv2)
+        # are paid later by the components that actually use them. Each probe
+        # is a microsecond path lookup, so they run serially.
+        available = {module: _module_available(module) for module in _DIAGNOSTIC_MODULES}
+        
+        for module, name in _CRITICAL_DEPS:
+            if available[module]:
+                report.append(('info', f"✓ {name}"))
+            else:
                 errors.append(f"{name} NOT INSTALLED")
-                self.logger.error(f"❌ {name}: NOT INSTALLED - {e}")
+                report.append(('error', f"❌ {name}: NOT INSTALLED - No module named '{module}'"))
         
         # Check 5: PaddleX[ocr] extra dependencies
-        self.logger.info("")
-        self.logger.info("🔧 CHECKING PADDLEX[OCR] DEPENDENCIES:")
-        self.logger.info("-" * 70)
-        
-        ocr_deps = {
-            'einops': 'einops',
-            'ftfy': 'ftfy',
-            'imagesize': 'imagesize',
-            'jinja2': 'Jinja2',
-            'lxml': 'lxml',
-            'openpyxl': 'openpyxl',
-            'premailer': 'premailer',
-            'pypdfium2': 'pypdfium2',
-            'regex': 'regex',
-            'sklearn': 'scikit-learn',
-            'tiktoken': 'tiktoken',
-            'tokenizers': 'tokenizers',
-        }
+        flush()
+        report.append(('info', ""))
+        report.append(('info', "🔧 CHECKING PADDLEX[OCR] DEPENDENCIES:"))
+        report.append(('info', "-" * 70))
         
         missing_ocr_deps = []
-        for module, name in ocr_deps.items():
-            try:
-                __import__(module)
-                self.logger.info(f"✓ {name}")
-            except ImportError:
+        for module, name in _OCR_DEPS:
+            if available[module]:
+                report.append(('info', f"✓ {name}"))
+            else:
                 missing_ocr_deps.append(name)
-                self.logger.error(f"❌ {name}: MISSING")
+                report.append(('error', f"❌ {name}: MISSING"))
         
         if missing_ocr_deps:
             errors.append(f"Missing {len(missing_ocr_deps)} paddlex[ocr] dependencies")
         
         # Check 6: PDF processing libraries
-        self.logger.info("")
-        self.logger.info("📄 CHECKING PDF LIBRARIES:")
-        self.logger.info("-" * 70)
+        flush()
+        report.append(('info', ""))
+        report.append(('info', "📄 CHECKING PDF LIBRARIES:"))
+        report.append(('info', "-" * 70))
         
-        pdf_deps = {
-            'img2pdf': ('img2pdf', False),
-            'PyPDF2': ('PyPDF2', False),
-            'reportlab': ('reportlab', False),
-        }
-        
-        for module, (name, required) in pdf_deps.items():
-            try:
-                __import__(module)
-                self.logger.info(f"✓ {name}")
-            except ImportError:
+        for module, name, required in _PDF_DEPS:
+            if available[module]:
+                report.append(('info', f"✓ {name}"))
+            else:
                 if required:
                     errors.append(f"{name} NOT INSTALLED")
-                    self.logger.error(f"❌ {name}: NOT INSTALLED")
+                    report.append(('error', f"❌ {name}: NOT INSTALLED"))
                 else:
                     warnings.append(f"{name} not installed (optional)")
-                    self.logger.warning(f"⚠ {name}: Not installed (slower PDF generation)")
+                    report.append(('warning', f"⚠ {name}: Not installed (slower PDF generation)"))
         
         # Check 7: Additional processing libraries
-        self.logger.info("")
-        self.logger.info("🛠️ CHECKING PROCESSING LIBRARIES:")
-        self.logger.info("-" * 70)
+        flush()
+        report.append(('info', ""))
+        report.append(('info', "🛠️ CHECKING PROCESSING LIBRARIES:"))
+        report.append(('info', "-" * 70))
         
-        processing_deps = {
-            'scipy': 'SciPy',
-            'yaml': 'PyYAML',
-            'psutil': 'psutil',
-        }
-        
-        for module, name in processing_deps.items():
-            try:
-                __import__(module)
-                self.logger.info(f"✓ {name}")
-            except ImportError:
+        for module, name in _PROCESSING_DEPS:
+            if available[module]:
+                report.append(('info', f"✓ {name}"))
+            else:
                 warnings.append(f"{name} not installed")
-                self.logger.warning(f"⚠ {name}: Not installed")
+                report.append(('warning', f"⚠ {name}: Not installed"))
         
         # Check 8: Test PaddleOCR initialization
-        self.logger.info("")
-        self.logger.info("🧪 TESTING PADDLEOCR INITIALIZATION:")
-        self.logger.info("-" * 70)
+        flush()
+        report.append(('info', ""))
+        report.append(('info', "🧪 TESTING PADDLEOCR INITIALIZATION:"))
+        report.append(('info', "-" * 70))
         
-        try:
-            from paddleocr import PaddleOCR
-            # Try to create instance without actually using it
-            self.logger.info(f"✓ PaddleOCR class importable")
-            
-            # Check if paddlex dependency checker is working
+        if not (deep or _IS_FROZEN):
+            # Locating the package is enough here - importing paddle takes seconds
+            if available['paddleocr']:
+                report.append(('info', "✓ PaddleOCR package found (use --deep-diagnostics to test import)"))
+            else:
+                errors.append("PaddleOCR initialization test failed: No module named 'paddleocr'")
+                report.append(('error', "❌ PaddleOCR package not found"))
+        else:
             try:
-                from paddlex.utils import deps
-                self.logger.info(f"✓ paddlex.utils.deps accessible")
+                from paddleocr import PaddleOCR
+                # Try to create instance without actually using it
+                report.append(('info', f"✓ PaddleOCR class importable"))
+            
+                # Check if paddlex dependency checker is working
+                try:
+                    from paddlex.utils import deps
+                    report.append(('info', f"✓ paddlex.utils.deps accessible"))
                 
-                # Check if it's been patched (in frozen mode)
-                if is_frozen:
-                    if hasattr(deps, 'require_extra'):
-                        self.logger.info(f"✓ paddlex.utils.deps.require_extra available")
-                    else:
-                        warnings.append("paddlex.utils.deps.require_extra not found")
-            except ImportError as e:
-                errors.append(f"paddlex.utils.deps import failed: {e}")
-                self.logger.error(f"❌ paddlex.utils.deps: {e}")
+                    # Check if it's been patched (in frozen mode)
+                    if _IS_FROZEN:
+                        if hasattr(deps, 'require_extra'):
+                            report.append(('info', f"✓ paddlex.utils.deps.require_extra available"))
+                        else:
+                            warnings.append("paddlex.utils.deps.require_extra not found")
+                except ImportError as e:
+                    errors.append(f"paddlex.utils.deps import failed: {e}")
+                    report.append(('error', f"❌ paddlex.utils.deps: {e}"))
                 
-        except Exception as e:
-            errors.append(f"PaddleOCR initialization test failed: {e}")
-            self.logger.error(f"❌ PaddleOCR initialization test failed: {e}")
+            except Exception as e:
+                errors.append(f"PaddleOCR initialization test failed: {e}")
+                report.append(('error', f"❌ PaddleOCR initialization test failed: {e}"))
         
         # Check 9: System resources
-        self.logger.info("")
-        self.logger.info("💻 SYSTEM RESOURCES:")
-        self.logger.info("-" * 70)
+        flush()
+        report.append(('info', ""))
+        report.append(('info', "💻 SYSTEM RESOURCES:"))
+        report.append(('info', "-" * 70))
         
         try:
-            import psutil
-            ram_gb = psutil.virtual_memory().total / (1024**3)
-            available_ram_gb = psutil.virtual_memory().available / (1024**3)
+            memory = psutil.virtual_memory()  # one /proc/meminfo read for both figures
+            ram_gb = memory.total / (1024**3)
+            available_ram_gb = memory.available / (1024**3)
             cpu_cores = psutil.cpu_count()
-            self.logger.info(f"✓ System RAM: {ram_gb:.1f} GB ({available_ram_gb:.1f} GB available)")
-            self.logger.info(f"✓ CPU Cores: {cpu_cores}")
+            report.append(('info', f"✓ System RAM: {ram_gb:.1f} GB ({available_ram_gb:.1f} GB available)"))
+            report.append(('info', f"✓ CPU Cores: {cpu_cores}"))
             
             if available_ram_gb < 2:
                 warnings.append(f"Low available RAM ({available_ram_gb:.1f} GB)")
@@ -725,35 +947,43 @@ class PageReorderCLI:
             warnings.append(f"Could not detect system resources: {e}")
         
         # Final summary
-        self.logger.info("")
-        self.logger.info("=" * 70)
+        flush()
+        report.append(('info', ""))
+        report.append(('info', "=" * 70))
         
         if errors:
-            self.logger.error(f"❌ DIAGNOSTICS FAILED - {len(errors)} CRITICAL ERRORS:")
+            report.append(('error', f"❌ DIAGNOSTICS FAILED - {len(errors)} CRITICAL ERRORS:"))
             for error in errors:
-                self.logger.error(f"   • {error}")
-            self.logger.error("")
-            self.logger.error("⚠️  APPLICATION MAY NOT FUNCTION CORRECTLY!")
-            self.logger.error("   Please fix the errors above before processing.")
+                report.append(('error', f"   • {error}"))
+            report.append(('error', ""))
+            report.append(('error', "⚠️  APPLICATION MAY NOT FUNCTION CORRECTLY!"))
+            report.append(('error', "   Please fix the errors above before processing."))
         elif warnings:
-            self.logger.warning(f"⚠️  DIAGNOSTICS PASSED WITH {len(warnings)} WARNINGS:")
+            report.append(('warning', f"⚠️  DIAGNOSTICS PASSED WITH {len(warnings)} WARNINGS:"))
             for warning in warnings:
-                self.logger.warning(f"   • {warning}")
-            self.logger.info("")
-            self.logger.info("✅ System ready - but some features may be limited")
+                report.append(('warning', f"   • {warning}"))
+            report.append(('info', ""))
+            report.append(('info', "✅ System ready - but some features may be limited"))
         else:
-            self.logger.info("✅ ALL DIAGNOSTICS PASSED - SYSTEM FULLY READY!")
+            report.append(('info', "✅ ALL DIAGNOSTICS PASSED - SYSTEM FULLY READY!"))
         
-        self.logger.info("=" * 70)
+        report.append(('info', "=" * 70))
+        flush()
         
-        # Pause if there are errors (give user time to read)
-        if errors and is_frozen:
-            import time
-            self.logger.error("\n⏸️  Pausing for 10 seconds - please review errors above...")
-            time.sleep(10)
+        # Pause if there are errors (give user time to read) - only when someone
+        # is at a console; scripted/GUI runs (no TTY stdin) continue immediately.
+        # Set MFPAGE_DIAG_PAUSE=0 to never pause.
+        if (errors and _IS_FROZEN and os.environ.get('MFPAGE_DIAG_PAUSE', '1') != '0'
+                and sys.stdin is not None and sys.stdin.isatty()):
+            self.logger.error("\n⏸️  Please review errors above...")
+            try:
+                input("Press Enter to continue...")
+            except EOFError:
+                pass
 
+@lru_cache(maxsize=1)
 def create_argument_parser() -> argparse.ArgumentParser:
-    """Create command line argument parser"""
+    """Create command line argument parser (built once, then reused)"""
     parser = argparse.ArgumentParser(
         description="AI Page Reordering Automation System",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -773,25 +1003,25 @@ Examples:
     parser.add_argument('--output', '-o',
                       help='Output directory (default: input_dir/reordered)')
     
-    parser.add_argument('--denoise', choices=['on', 'off'],
+    parser.add_argument('--denoise', choices=_ON_OFF_CHOICES,
                       help='Enable/disable image denoising')
     
-    parser.add_argument('--deskew', choices=['on', 'off'],
+    parser.add_argument('--deskew', choices=_ON_OFF_CHOICES,
                       help='Enable/disable image deskewing')
     
-    parser.add_argument('--ocr', choices=['on', 'off'],
+    parser.add_argument('--ocr', choices=_ON_OFF_CHOICES,
                       help='Force enable/disable OCR processing')
     
     parser.add_argument('--confidence', type=int, metavar='0-100',
                       help='Confidence threshold for auto-ordering (default: 85)')
     
-    parser.add_argument('--output-format', choices=['pdf', 'images', 'both'],
+    parser.add_argument('--output-format', choices=_OUTPUT_FORMAT_CHOICES,
                       help='Output format (default: pdf)')
     
-    parser.add_argument('--preset', choices=['quick', 'deep', 'manual'],
+    parser.add_argument('--preset', choices=_PRESET_CHOICES,
                       help='Processing preset (quick/deep/manual)')
     
-    parser.add_argument('--memory', choices=['on', 'off'], default='on',
+    parser.add_argument('--memory', choices=_ON_OFF_CHOICES, default='on',
                       help='Enable/disable learning memory (default: on)')
     
     parser.add_argument('--verbose', '-v', action='store_true',
@@ -806,21 +1036,35 @@ Examples:
     parser.add_argument('--skip-ml-prompt', action='store_true',
                       help='Skip ML teaching prompt (use PaddleOCR only)')
     
+    parser.add_argument('--diagnostics', choices=_DIAGNOSTICS_CHOICES, default='auto',
+                      help='Startup dependency diagnostics (default: auto - EXE builds only)')
+    
+    parser.add_argument('--deep-diagnostics', action='store_true',
+                      help='Import PaddleOCR during startup diagnostics to test initialization')
+    
     return parser
 
 def main():
     """Main entry point"""
+    # Process-pool OCR spawns workers from the frozen EXE, which must not
+    # re-run the CLI in them
+    multiprocessing.freeze_support()
+    
     parser = create_argument_parser()
+    # Parse before anything else is built - --help and bad arguments
+    # exit here without touching components or heavy imports
     args = parser.parse_args()
     
     # Load custom config if specified
     if args.config and Path(args.config).exists():
-        config.config_path = Path(args.config)
-        config.config = config._load_config()
+        config.reload(args.config)
     
     # Create and run CLI
     cli = PageReorderCLI()
-    success = cli.run(args)
+    try:
+        success = cli.run(args)
+    finally:
+        cli.close()
     
     sys.exit(0 if success else 1)
 
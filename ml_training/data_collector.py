@@ -8,12 +8,44 @@ import os
 import cv2
 import json
 import shutil
+import itertools
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Tuple
 import numpy as np
 
 
+# Every collected corner is resized to this (width, height)
+SAMPLE_SIZE = (200, 200)
+
+# Baseline (non-progressive, default Huffman) JPEG at quality 85 - the fastest
+# libjpeg path, and plenty for CNN training input (the detector OCRs corners at 85 too)
+JPEG_PARAMS = [int(cv2.IMWRITE_JPEG_QUALITY), 85,
+               int(cv2.IMWRITE_JPEG_OPTIMIZE), 0,
+               int(cv2.IMWRITE_JPEG_PROGRESSIVE), 0]
+
+# Negative samples with less pixel variation than this are blank margins;
+# only every BLANK_KEEP_EVERY-th of them is stored to keep "none" from swamping the digits
+BLANK_STD_THRESHOLD = 5.0
+BLANK_KEEP_EVERY = 8
+
+# Samples waiting on the I/O pool; past this, collecting waits for the oldest
+# (back-pressure rather than dropping samples or queueing without bound)
+MAX_PENDING_SAMPLES = 128
+
+
+def _encode_and_write(path: str, sample: np.ndarray):
+    """JPEG-encode a sample and write it to disk (runs on the collector's I/O pool)"""
+    ok, buffer = cv2.imencode('.jpg', sample, JPEG_PARAMS)
+    if not ok:
+        raise OSError(f"could not encode {path}")
+    with open(path, 'wb') as f:
+        f.write(buffer)
+
+
 class TrainingDataCollector:
     """Collects and organizes training data from OCR processing"""
     
@@ -22,10 +54,27 @@ class TrainingDataCollector:
         self.dataset_info = {
             'created': datetime.now().isoformat(),
             'total_images': 0,
-            'classes': {},
-            'metadata': []
+            'classes': Counter(),
+            'metadata_file': 'metadata/metadata.jsonl'  # One JSON object per sample
         }
         
+        # Samples are JPEG-encoded and written in the background, so the
+        # OCR threads only pay for the 200x200 resize
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='collector-io')
+        self._pending = deque()
+        self._pending_lock = threading.Lock()
+        
+        # Sample filenames: one session stamp plus a running number, instead of
+        # formatting the clock for every sample (next() on a count is thread-safe)
+        self._session = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._sample_ids = itertools.count(1)
+        
+        # Near-blank negatives seen so far (for BLANK_KEEP_EVERY subsampling)
+        self._blank_seen = itertools.count()
+        
+        # Class folders already created - mkdir once per class, not per sample
+        self._known_classes = set()
+        
         # Create directory structure
         self.setup_directories()
     
@@ -41,6 +90,15 @@ class TrainingDataCollector:
         self.corners_dir.mkdir(parents=True, exist_ok=True)
         self.metadata_dir.mkdir(parents=True, exist_ok=True)
         
+        # Metadata paths are relative to output_dir - resolved once, not per sample
+        self._corners_rel = str(self.corners_dir.relative_to(self.output_dir))
+        
+        # Sample metadata is appended as JSON lines instead of kept in memory
+        # and rewritten in full on every save
+        self._metadata_file = open(self.metadata_dir / "metadata.jsonl", 'a',
+                                   encoding='utf-8', buffering=1 << 20)
+        self._metadata_lock = threading.Lock()
+        
         # Class directories (will be created as needed)
         print(f"✅ Directories ready at: {self.output_dir}")
     
@@ -69,40 +127,56 @@ class TrainingDataCollector:
             # Clean label (remove spaces, special chars)
             class_label = detected_number.strip().lower()
         
+        # Page numbers are read from luminance - store single-channel samples
+        # (the trainers and predictor read them as grayscale anyway)
+        if corner_region.ndim == 3 and corner_region.shape[2] == 3:
+            corner_region = cv2.cvtColor(corner_region, cv2.COLOR_BGR2GRAY)
+        
+        # Resize to standard size (200x200) - the sample is encoded after this
+        # call returns, so it gets its own array rather than a view of the caller's
+        if corner_region.shape[:2] == SAMPLE_SIZE[::-1]:
+            standardized = np.array(corner_region)
+        else:
+            standardized = cv2.resize(corner_region, SAMPLE_SIZE, interpolation=cv2.INTER_AREA)
+        
+        # Near-uniform blank margins make up most negatives - keep only 1 in BLANK_KEEP_EVERY
+        if class_label == "none" and standardized.std() < BLANK_STD_THRESHOLD:
+            if next(self._blank_seen) % BLANK_KEEP_EVERY:
+                return
+        
         # Create class directory if doesn't exist
         class_dir = self.corners_dir / class_label
-        class_dir.mkdir(exist_ok=True)
+        if class_label not in self._known_classes:
+            class_dir.mkdir(exist_ok=True)
+            self._known_classes.add(class_label)
         
         # Generate unique filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        timestamp = f"{self._session}_{next(self._sample_ids):09d}"
         image_filename = f"{class_label}_{corner_name}_{timestamp}.jpg"
-        image_path = class_dir / image_filename
+        image_path = os.path.join(class_dir, image_filename)
         
-        # Resize to standard size (200x200)
-        standardized = cv2.resize(corner_region, (200, 200), interpolation=cv2.INTER_AREA)
-        
-        # Save image
-        cv2.imwrite(str(image_path), standardized, [cv2.IMWRITE_JPEG_QUALITY, 95])
+        # Save image (encoded and written by the I/O pool)
+        self._pending.append(self._io_pool.submit(_encode_and_write, image_path, standardized))
+        self._reap(MAX_PENDING_SAMPLES)
         
         # Save metadata
         metadata = {
-            'image_path': str(image_path.relative_to(self.output_dir)),
+            'image_path': os.path.join(self._corners_rel, class_label, image_filename),
             'class_label': class_label,
             'corner_name': corner_name,
             'confidence': confidence,
             'source_page': page_image_path,
             'book_name': book_name,
             'timestamp': timestamp,
-            'image_size': (200, 200)
+            'image_size': SAMPLE_SIZE
         }
         
-        self.dataset_info['metadata'].append(metadata)
-        
-        # Update class count
-        if class_label not in self.dataset_info['classes']:
-            self.dataset_info['classes'][class_label] = 0
-        self.dataset_info['classes'][class_label] += 1
-        self.dataset_info['total_images'] += 1
+        line = json.dumps(metadata, separators=(',', ':'), ensure_ascii=False) + '\n'
+        # Update class count under the same lock - OCR threads collect concurrently
+        with self._metadata_lock:
+            self._metadata_file.write(line)
+            self.dataset_info['classes'][class_label] += 1
+            self.dataset_info['total_images'] += 1
     
     def collect_from_ocr_result(self,
                                  page_image_path: str,
@@ -147,11 +221,45 @@ class TrainingDataCollector:
                     book_name=book_name
                 )
     
+    def _finish_write(self, future):
+        """Report a failed background write - a lost sample must not stop OCR"""
+        try:
+            future.result()
+        except Exception as e:
+            print(f"⚠️ Failed to save sample: {e}")
+    
+    def _reap(self, limit: int):
+        """Collect finished writes, waiting on the oldest while more than limit are in flight"""
+        with self._pending_lock:
+            while self._pending and (len(self._pending) > limit or self._pending[0].done()):
+                self._finish_write(self._pending.popleft())
+    
+    def flush(self):
+        """Wait until all collected samples and their metadata are written to disk"""
+        self._reap(0)
+        with self._metadata_lock:
+            self._metadata_file.flush()
+    
+    def close(self):
+        """Finish pending writes, then release the I/O pool and the metadata file"""
+        self._reap(0)
+        self._io_pool.shutdown(wait=True)
+        with self._metadata_lock:
+            if not self._metadata_file.closed:
+                self._metadata_file.close()
+    
     def save_dataset_info(self):
         """Save dataset metadata to JSON"""
+        self.flush()
         info_path = self.metadata_dir / "dataset_info.json"
-        with open(info_path, 'w', encoding='utf-8') as f:
-            json.dump(self.dataset_info, f, indent=2)
+        # Encode once and write once - json.dump streams many small writes.
+        # Written next to the target and swapped in, so a crash never leaves half a file
+        with self._metadata_lock:
+            data = json.dumps(self.dataset_info, indent=2, ensure_ascii=False)
+        temp_path = info_path.with_name(info_path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(temp_path, info_path)
         print(f"💾 Dataset info saved to: {info_path}")
     
     def generate_report(self) -> str:
@@ -167,19 +275,14 @@ class TrainingDataCollector:
         report.append("CLASS DISTRIBUTION:")
         report.append("-" * 70)
         
-        # Sort classes by count
-        sorted_classes = sorted(
-            self.dataset_info['classes'].items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        
-        for class_label, count in sorted_classes[:20]:  # Top 20
+        # Top 20 classes by count
+        class_counts = self.dataset_info['classes']
+        for class_label, count in class_counts.most_common(20):
             bar = "█" * (count // 10)
             report.append(f"  {class_label:>10s} : {count:>4d} images {bar}")
         
-        if len(sorted_classes) > 20:
-            report.append(f"  ... and {len(sorted_classes) - 20} more classes")
+        if len(class_counts) > 20:
+            report.append(f"  ... and {len(class_counts) - 20} more classes")
         
         report.append("=" * 70)
         
@@ -275,3 +378,5 @@ if __name__ == "__main__":
         print("\n⚠️ Dataset has issues:")
         for issue in issues:
             print(f"  {issue}")
+    
+    collector.close()
@@ -15,31 +15,39 @@ import cv2
 import numpy as np
 
 
+# Collection state lives in module globals - the patched OCR corner hook
+# checks it on every corner, and a global read is the cheapest check there
+_enabled = False
+_collector = None
+
+
 class DataCollectionMode:
     """Singleton to enable/disable data collection globally"""
-    _instance = None
-    _enabled = False
-    _collector = None
     
     @classmethod
     def enable(cls, output_dir: str = "ml_training/training_data"):
         """Enable data collection mode"""
-        if cls._collector is None:
-            cls._collector = TrainingDataCollector(output_dir)
-            cls._enabled = True
+        global _enabled, _collector
+        if _collector is None:
+            _collector = TrainingDataCollector(output_dir)
+            _enabled = True
             print("✅ Training data collection ENABLED")
             print(f"📁 Data will be saved to: {output_dir}")
-        return cls._collector
+        return _collector
     
     @classmethod
     def disable(cls):
         """Disable data collection and save results"""
-        if cls._collector is not None:
-            cls._collector.save_dataset_info()
-            report = cls._collector.generate_report()
+        global _enabled, _collector
+        collector = _collector
+        if collector is not None:
+            # Stop the OCR hook first, so nothing is collected while closing
+            _enabled = False
+            collector.save_dataset_info()
+            report = collector.generate_report()
             print("\n" + report)
             
-            is_valid, issues = cls._collector.verify_dataset()
+            is_valid, issues = collector.verify_dataset()
             if is_valid:
                 print("\n✅ Dataset is valid and ready for training!")
             else:
@@ -47,19 +55,21 @@ class DataCollectionMode:
                 for issue in issues:
                     print(f"  {issue}")
             
-            cls._enabled = False
+            # Closed collectors can't be reused - a later enable() starts a new one
+            collector.close()
+            _collector = None
             print("\n✅ Training data collection DISABLED")
-        return cls._collector
+        return collector
     
     @classmethod
     def is_enabled(cls):
         """Check if collection is enabled"""
-        return cls._enabled
+        return _enabled
     
     @classmethod
     def get_collector(cls):
         """Get the collector instance"""
-        return cls._collector
+        return _collector
 
 
 def patch_paddle_detector():
@@ -77,9 +87,10 @@ def patch_paddle_detector():
         # Call original method
         candidates = original_ocr_corner(self, region, corner_name, offset_x, offset_y)
         
-        # Collect training data if enabled
-        if DataCollectionMode.is_enabled():
-            collector = DataCollectionMode.get_collector()
+        # Collect training data if enabled (the collector resizes the region
+        # before returning, so it can be passed without copying)
+        if _enabled:
+            collector = _collector
             
             if collector and candidates:
                 # Get best candidate from this corner
@@ -90,7 +101,7 @@ def patch_paddle_detector():
                     page_image_path=getattr(self, '_current_page_path', 'unknown'),
                     detected_number=best_candidate.text,
                     corner_name=corner_name,
-                    corner_region=region.copy(),
+                    corner_region=region,
                     confidence=best_candidate.confidence,
                     book_name=getattr(self, '_current_book_name', 'unknown')
                 )
@@ -100,7 +111,7 @@ def patch_paddle_detector():
                     page_image_path=getattr(self, '_current_page_path', 'unknown'),
                     detected_number=None,
                     corner_name=corner_name,
-                    corner_region=region.copy(),
+                    corner_region=region,
                     confidence=0.0,
                     book_name=getattr(self, '_current_book_name', 'unknown')
                 )
@@ -12,9 +12,114 @@ from PIL import Image, ImageTk
 from pathlib import Path
 import json
 import time
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-# Module-level cache to prevent PhotoImage garbage collection
-_IMAGE_CACHE = {}
+# Image types offered for labeling (matched case-insensitively)
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png'}
+
+# Number of upcoming images decoded in the background while the current one is labeled
+PREFETCH_AHEAD = 2
+
+# Zoomed frames kept for the current image (the zoom steps are discrete powers of 1.25)
+ZOOM_CACHE_SIZE = 8
+
+# Wheel zoom uses linear interpolation and is redrawn with cubic once the wheel rests this long
+HQ_REDRAW_DELAY_MS = 150
+
+# Largest on-screen page size before zoom (width, height)
+DISPLAY_MAX_SIZE = (1000, 800)
+
+# JPEG decode-time reductions, largest first
+_REDUCED_DECODE_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+
+# Recently decoded pages are kept so Previous/Next and prefetch don't decode twice
+@lru_cache(maxsize=8)
+def _decode_display(path_str):
+    """Decode an image at display size as (RGB array, scale from original), or (None, 0.0)"""
+    max_w, max_h = DISPLAY_MAX_SIZE
+    
+    # Header-only read; EXIF rotation may swap the sides, so allow for either orientation
+    try:
+        with Image.open(path_str) as header:
+            w, h = header.size
+        fit = max(min(max_w / w, max_h / h), min(max_w / h, max_h / w))
+    except Exception:
+        fit = 1.0
+    
+    # Let libjpeg scale down while decoding, then finish with a small resize
+    reduction, flag = 1, cv2.IMREAD_COLOR
+    for factor, reduced_flag in _REDUCED_DECODE_FLAGS:
+        if fit <= 1.0 / factor:
+            reduction, flag = factor, reduced_flag
+            break
+    
+    image = cv2.imread(path_str, flag)
+    if image is None:
+        return None, 0.0
+    
+    h, w = image.shape[:2]
+    scale = min(max_w / w, max_h / h, 1.0)
+    if scale < 1.0:
+        image = cv2.resize(image, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
+    # Convert after the resize so only display-size pixels are touched
+    return cv2.cvtColor(image, cv2.COLOR_BGR2RGB), scale / reduction
+
+def _crop_and_save(image_path, box, display_size, save_path):
+    """Crop a display-space box from the full-resolution original and save it at 200x200
+    
+    Returns True once the sample is written, False if it could not be saved
+    """
+    try:
+        # Decode the full-resolution original only now that a crop is needed
+        full_image = cv2.imread(str(image_path))
+        if full_image is None:
+            print(f"[ERROR] Could not load image for crop: {image_path.name}")
+            return False
+        
+        # Get sizes for coordinate conversion
+        disp_x1, disp_y1, disp_x2, disp_y2 = box
+        disp_w, disp_h = display_size          # Displayed image size
+        orig_h, orig_w = full_image.shape[:2]  # Original image size
+        
+        # Calculate scale ratio (original / displayed)
+        scale_x = orig_w / disp_w
+        scale_y = orig_h / disp_h
+        
+        # Convert coordinates to original image space
+        orig_x1 = int(disp_x1 * scale_x)
+        orig_y1 = int(disp_y1 * scale_y)
+        orig_x2 = int(disp_x2 * scale_x)
+        orig_y2 = int(disp_y2 * scale_y)
+        
+        # Ensure coordinates are within bounds of original image
+        orig_x1 = max(0, min(orig_x1, orig_w-1))
+        orig_x2 = max(0, min(orig_x2, orig_w))
+        orig_y1 = max(0, min(orig_y1, orig_h-1))
+        orig_y2 = max(0, min(orig_y2, orig_h))
+        
+        # Crop from original high-resolution image for best quality
+        crop = full_image[orig_y1:orig_y2, orig_x1:orig_x2]
+        if crop.size == 0:
+            print(f"[ERROR] Selected region is empty in the original: {image_path.name}")
+            return False
+        
+        # Resize to 200x200
+        crop_resized = cv2.resize(crop, (200, 200), interpolation=cv2.INTER_AREA)
+        if not cv2.imwrite(str(save_path), crop_resized):
+            print(f"[ERROR] Could not write crop: {save_path}")
+            return False
+        return True
+    except Exception as e:
+        print(f"[ERROR] Failed to save crop {save_path.name}: {e}")
+        return False
 
 class InteractiveLabeler:
     """GUI for interactive manual labeling with region selection"""
@@ -24,6 +129,7 @@ class InteractiveLabeler:
         self.output_folder = Path(output_folder)
         self.corners_dir = self.output_folder / "corners"
         self.corners_dir.mkdir(parents=True, exist_ok=True)
+        self._known_dirs = set()  # Labels whose class directory already exists
         
         # Get all images
         self.image_files = self.get_image_files()
@@ -40,6 +146,8 @@ class InteractiveLabeler:
         self.zoom_level = 1.0
         self.min_zoom = 0.5
         self.max_zoom = 4.0
+        self._zoom_interp = cv2.INTER_CUBIC
+        self._hq_after_id = None
         
         # Pan state
         self.pan_x = 0
@@ -47,9 +155,16 @@ class InteractiveLabeler:
         self.panning = False
         self.pan_start_x = 0
         self.pan_start_y = 0
+        self._zoom_cache = OrderedDict()  # (image index, zoom) -> zoomed RGB array
+        
+        # Upcoming images are decoded into the _decode_display cache by a daemon thread
+        self._prefetch_queue = queue.Queue()
+        threading.Thread(target=self._prefetch_loop, name='labeler-prefetch', daemon=True).start()
         
-        # Image reference keeper to prevent garbage collection
-        self._image_keeper = []
+        # Crops are decoded and written in the background; shut down (waiting) before exit.
+        # Labels are only counted once their crop is on disk (by the save threads).
+        self._save_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='labeler-save')
+        self._stats_lock = threading.Lock()
         
         # Stats
         self.stats = {
@@ -63,19 +178,14 @@ class InteractiveLabeler:
     
     def get_image_files(self):
         """Get all image files from folder"""
-        files = []
-        for ext in ['*.jpg', '*.jpeg', '*.png', '*.JPG', '*.JPEG', '*.PNG']:
-            matches = list(self.image_folder.glob(ext))
-            files.extend(matches)
-            if matches:
-                print(f"[DEBUG] Found {len(matches)} files with extension {ext}")
-        
-        # Remove duplicates (case-insensitive filesystems might cause duplicates)
-        unique_files = list(set(files))
-        print(f"[DEBUG] Total files found: {len(files)}, Unique files: {len(unique_files)}")
+        # One directory pass with a case-insensitive suffix check (no duplicates to remove)
+        with os.scandir(self.image_folder) as entries:
+            files = [Path(entry.path) for entry in entries
+                     if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS and entry.is_file()]
+        print(f"[DEBUG] Total files found: {len(files)}")
         print(f"[DEBUG] Image folder: {self.image_folder}")
         
-        return sorted(unique_files)
+        return sorted(files)
     
     def setup_gui(self):
         """Create the GUI interface"""
@@ -274,8 +384,9 @@ Tip: Zoom 200-300%, pan to corner, select tight!
         # Ensure window is fully initialized before loading images
         self.root.update()
         
-        # Schedule image loading to run AFTER mainloop starts (critical for PhotoImage)
-        self.root.after(500, self._delayed_load)  # 500ms delay for stability
+        # Schedule image loading to run AFTER mainloop starts (critical for PhotoImage);
+        # the update() above already gave the canvas its real size, so no extra delay
+        self.root.after_idle(self._delayed_load)
     
     def _delayed_load(self):
         """Load first image after mainloop has started"""
@@ -283,7 +394,7 @@ Tip: Zoom 200-300%, pan to corner, select tight!
         try:
             # Force widget to fully initialize
             self.root.update_idletasks()
-            self.image_label.update()
+            self.image_canvas.update()
             
             self.load_current_image()
             print("[DEBUG] First image loaded successfully")
@@ -323,47 +434,32 @@ Tip: Zoom 200-300%, pan to corner, select tight!
         
         image_path = self.image_files[self.current_index]
         
-        # Load image with OpenCV
-        self.current_cv_image = cv2.imread(str(image_path))
-        if self.current_cv_image is None:
+        # Decode at display size (usually already done by the prefetch thread);
+        # the full-resolution original is only read in save_and_next for the crop
+        rgb_image, scale = _decode_display(str(image_path))
+        if rgb_image is None:
             messagebox.showerror("Error", f"Could not load image: {image_path.name}")
             self.skip_image()
             return
         
-        # Convert to RGB for PIL
-        rgb_image = cv2.cvtColor(self.current_cv_image, cv2.COLOR_BGR2RGB)
-        
-        # Resize to fit display (max 1000x800)
-        h, w = rgb_image.shape[:2]
-        max_w, max_h = 1000, 800
-        scale = min(max_w/w, max_h/h, 1.0)
-        
-        if scale < 1.0:
-            new_w, new_h = int(w * scale), int(h * scale)
-            rgb_image = cv2.resize(rgb_image, (new_w, new_h))
+        # Zoomed frames of the previous image are no longer needed
+        for key in [k for k in self._zoom_cache if k[0] != self.current_index]:
+            del self._zoom_cache[key]
         
         # Store scale for coordinate conversion
         self.base_scale = scale  # Base scale (fit to screen)
         self.display_scale = scale  # Current display scale (base * zoom)
-        self.display_image = rgb_image.copy()
-        self.original_rgb = rgb_image.copy()  # Keep original for zoom
+        self.original_rgb = rgb_image  # Keep original for zoom (never modified in place)
         
         # Apply zoom to image
         zoomed_rgb = self._apply_zoom(rgb_image)
         
         # Store the displayed zoomed image for accurate cropping
-        self.displayed_zoomed_rgb = zoomed_rgb.copy()
+        self.displayed_zoomed_rgb = zoomed_rgb
         
         # Convert to PIL and Tk
-        # CRITICAL FIX: Assign to self.photo BEFORE canvas display to prevent GC
-        # Explicitly specify master widget to prevent reference issues
         self.pil_image = Image.fromarray(zoomed_rgb)
-        self.photo = ImageTk.PhotoImage(self.pil_image, master=self.image_canvas)  # Use master parameter
-        
-        # Add multiple references BEFORE displaying to prevent premature GC
-        self.photo.image = self.pil_image
-        self._image_keeper.append(self.photo)
-        _IMAGE_CACHE[f'image_{self.current_index}'] = self.photo  # Module-level cache
+        self._update_photo()
         
         # Calculate center position for image on canvas
         canvas_width = self.image_canvas.winfo_width()
@@ -379,18 +475,8 @@ Tip: Zoom 200-300%, pan to corner, select tight!
         self.image_offset_x = max(0, (canvas_width - img_width) // 2)
         self.image_offset_y = max(0, (canvas_height - img_height) // 2)
         
-        # Clear canvas and display image at calculated position
-        self.image_canvas.delete("all")
-        # Force canvas update before creating new image
-        self.image_canvas.update_idletasks()
-        self.canvas_image_id = self.image_canvas.create_image(
-            self.image_offset_x, 
-            self.image_offset_y,
-            anchor=tk.NW,  # Northwest anchor = top-left corner at specified position
-            image=self.photo
-        )
-        # Force canvas to redraw
-        self.image_canvas.update()
+        # Display image at calculated position
+        self._place_photo()
         
         # Update info
         self.filename_label.config(text=image_path.name)
@@ -406,23 +492,75 @@ Tip: Zoom 200-300%, pan to corner, select tight!
         self.pan_x = 0
         self.pan_y = 0
         self.zoom_label.config(text="100%")
+        
+        self._schedule_prefetch()
+    
+    def _schedule_prefetch(self):
+        """Queue the next images for background decoding"""
+        for index in range(self.current_index + 1,
+                           min(self.current_index + 1 + PREFETCH_AHEAD, len(self.image_files))):
+            self._prefetch_queue.put(index)
+    
+    def _prefetch_loop(self):
+        """Decode queued images on the background thread"""
+        while True:
+            index = self._prefetch_queue.get()
+            # Skip requests the user has already moved past
+            if self.current_index < index <= self.current_index + PREFETCH_AHEAD:
+                _decode_display(str(self.image_files[index]))
+    
+    def _update_photo(self):
+        """Copy self.pil_image into the Tk photo, reallocating only when the size changes"""
+        if self.photo is not None and (self.photo.width(), self.photo.height()) == self.pil_image.size:
+            self.photo.paste(self.pil_image)
+        else:
+            # self.photo is the only reference Tk needs; the old photo is freed once replaced
+            self.photo = ImageTk.PhotoImage(self.pil_image, master=self.image_canvas)
+    
+    def _place_photo(self):
+        """Show self.photo at the current offset, reusing the canvas item"""
+        self.image_canvas.delete("selection_rect")
+        if self.canvas_image_id is None:
+            self.canvas_image_id = self.image_canvas.create_image(
+                self.image_offset_x,
+                self.image_offset_y,
+                anchor=tk.NW,  # Northwest anchor = top-left corner at specified position
+                image=self.photo
+            )
+        else:
+            self.image_canvas.itemconfig(self.canvas_image_id, image=self.photo)
+            self.image_canvas.coords(self.canvas_image_id, self.image_offset_x, self.image_offset_y)
+        # Force canvas to redraw
+        self.image_canvas.update()
     
     def _apply_zoom(self, rgb_image):
         """Apply current zoom level to image"""
         if self.zoom_level == 1.0:
             return rgb_image
         
+        key = (self.current_index, round(self.zoom_level, 3))
+        cached = self._zoom_cache.get(key)
+        if cached is not None:
+            self._zoom_cache.move_to_end(key)
+            return cached
+        
         h, w = rgb_image.shape[:2]
         new_w = int(w * self.zoom_level)
         new_h = int(h * self.zoom_level)
         
         if self.zoom_level > 1.0:
-            # Zoom in - use INTER_CUBIC for better quality
-            zoomed = cv2.resize(rgb_image, (new_w, new_h), interpolation=cv2.INTER_CUBIC)
+            # Zoom in - INTER_CUBIC for quality, INTER_LINEAR while the wheel is moving
+            zoomed = cv2.resize(rgb_image, (new_w, new_h), interpolation=self._zoom_interp)
+            if self._zoom_interp != cv2.INTER_CUBIC:
+                return zoomed  # Draft frame - not cached, redrawn by _redraw_hq
         else:
             # Zoom out - use INTER_AREA for better downscaling
             zoomed = cv2.resize(rgb_image, (new_w, new_h), interpolation=cv2.INTER_AREA)
         
+        self._zoom_cache[key] = zoomed
+        while len(self._zoom_cache) > ZOOM_CACHE_SIZE:
+            self._zoom_cache.popitem(last=False)
+        
         return zoomed
     
     def zoom_in(self):
@@ -444,12 +582,25 @@ Tip: Zoom 200-300%, pan to corner, select tight!
     
     def on_mouse_wheel(self, event):
         """Handle mouse wheel zoom"""
+        # Fast interpolation while scrolling; full quality once the wheel rests
+        self._zoom_interp = cv2.INTER_LINEAR
+        if self._hq_after_id is not None:
+            self.root.after_cancel(self._hq_after_id)
+        self._hq_after_id = self.root.after(HQ_REDRAW_DELAY_MS, self._redraw_hq)
+        
         # Determine zoom direction
         if event.num == 5 or event.delta < 0:  # Scroll down or negative delta
             self.zoom_out()
         elif event.num == 4 or event.delta > 0:  # Scroll up or positive delta
             self.zoom_in()
     
+    def _redraw_hq(self):
+        """Redraw the zoomed image with cubic interpolation after wheel scrolling stops"""
+        self._hq_after_id = None
+        self._zoom_interp = cv2.INTER_CUBIC
+        if self.zoom_level > 1.0:
+            self._update_zoom()
+    
     def _update_zoom(self):
         """Update display with new zoom level"""
         if not hasattr(self, 'original_rgb'):
@@ -466,16 +617,11 @@ Tip: Zoom 200-300%, pan to corner, select tight!
         zoomed_rgb = self._apply_zoom(self.original_rgb)
         
         # Store the displayed zoomed image for accurate cropping
-        self.displayed_zoomed_rgb = zoomed_rgb.copy()
+        self.displayed_zoomed_rgb = zoomed_rgb
         
         # Update PIL and Tk image
         self.pil_image = Image.fromarray(zoomed_rgb)
-        self.photo = ImageTk.PhotoImage(self.pil_image, master=self.image_canvas)
-        
-        # Keep references to prevent GC
-        self.photo.image = self.pil_image
-        self._image_keeper.append(self.photo)
-        _IMAGE_CACHE[f'zoom_{self.current_index}_{self.zoom_level}'] = self.photo
+        self._update_photo()
         
         # Recalculate center position
         canvas_width = self.image_canvas.winfo_width()
@@ -491,15 +637,7 @@ Tip: Zoom 200-300%, pan to corner, select tight!
         self.image_offset_y = max(0, (canvas_height - img_height) // 2) + self.pan_y
         
         # Update canvas
-        self.image_canvas.delete("all")
-        self.image_canvas.update_idletasks()
-        self.canvas_image_id = self.image_canvas.create_image(
-            self.image_offset_x,
-            self.image_offset_y,
-            anchor=tk.NW,
-            image=self.photo
-        )
-        self.image_canvas.update()
+        self._place_photo()
         
         # Redraw selection if exists
         if self.start_x is not None and self.end_x is not None:
@@ -630,60 +768,53 @@ Tip: Zoom 200-300%, pan to corner, select tight!
         disp_x2 = int(max(self.start_x, self.end_x))
         disp_y2 = int(max(self.start_y, self.end_y))
         
-        # Get sizes for coordinate conversion
+        # Reject empty selections here; the crop itself runs in the background
         disp_h, disp_w = self.displayed_zoomed_rgb.shape[:2]  # Displayed image size
-        orig_h, orig_w = self.current_cv_image.shape[:2]      # Original image size
-        
-        # Calculate scale ratio (original / displayed)
-        scale_x = orig_w / disp_w
-        scale_y = orig_h / disp_h
-        
-        # Convert coordinates to original image space
-        orig_x1 = int(disp_x1 * scale_x)
-        orig_y1 = int(disp_y1 * scale_y)
-        orig_x2 = int(disp_x2 * scale_x)
-        orig_y2 = int(disp_y2 * scale_y)
-        
-        # Ensure coordinates are within bounds of original image
-        orig_x1 = max(0, min(orig_x1, orig_w-1))
-        orig_x2 = max(0, min(orig_x2, orig_w))
-        orig_y1 = max(0, min(orig_y1, orig_h-1))
-        orig_y2 = max(0, min(orig_y2, orig_h))
-        
-        # Crop from original high-resolution image for best quality
-        crop = self.current_cv_image[orig_y1:orig_y2, orig_x1:orig_x2]
-        
-        if crop.size == 0:
+        if min(disp_x2, disp_w) <= max(disp_x1, 0) or min(disp_y2, disp_h) <= max(disp_y1, 0):
             messagebox.showerror("Invalid Selection", "Selected region is too small!")
             return
         
-        # Resize to 200x200
-        crop_resized = cv2.resize(crop, (200, 200), interpolation=cv2.INTER_AREA)
-        
         # Save
         class_dir = self.corners_dir / label
-        class_dir.mkdir(exist_ok=True)
+        if label not in self._known_dirs:
+            class_dir.mkdir(exist_ok=True)
+            self._known_dirs.add(label)
         
         timestamp = str(int(time.time() * 1000))
         filename = f"{label}_{self.image_files[self.current_index].stem}_{timestamp}.jpg"
         save_path = class_dir / filename
         
-        cv2.imwrite(str(save_path), crop_resized)
-        
-        # Update stats
-        self.stats['total_labeled'] += 1
-        if label not in self.stats['labels_created']:
-            self.stats['labels_created'][label] = 0
-        self.stats['labels_created'][label] += 1
+        # Decode, crop and write off the UI thread so the next image shows immediately
+        future = self._save_pool.submit(self._save_sample, label, self.image_files[self.current_index],
+                                        (disp_x1, disp_y1, disp_x2, disp_y2), (disp_w, disp_h), save_path)
         
+        # Update stats (the label itself is counted by _save_sample once the crop is saved)
         self.stats['total_processed'] += 1
         
         self.update_stats_display()
+        self._refresh_stats_when_saved(future)
         
         # Next image
         self.current_index += 1
         self.load_current_image()
     
+    def _save_sample(self, label, *crop_args):
+        """Save one crop on a save thread and count its label only once it is on disk"""
+        if not _crop_and_save(*crop_args):
+            return
+        with self._stats_lock:
+            self.stats['total_labeled'] += 1
+            if label not in self.stats['labels_created']:
+                self.stats['labels_created'][label] = 0
+            self.stats['labels_created'][label] += 1
+    
+    def _refresh_stats_when_saved(self, future):
+        """Refresh the stats display once a background save has finished (UI thread)"""
+        if future.done():
+            self.update_stats_display()
+        else:
+            self.root.after(100, self._refresh_stats_when_saved, future)
+    
     def skip_image(self):
         """Skip current image"""
         self.stats['total_processed'] += 1
@@ -749,18 +880,32 @@ Tip: Zoom 200-300%, pan to corner, select tight!
         """Update statistics display"""
         self.stats_text.delete('1.0', tk.END)
         
-        stats_str = f"Processed: {self.stats['total_processed']}\n"
-        stats_str += f"Labeled: {self.stats['total_labeled']}\n"
-        stats_str += f"Skipped: {self.stats['total_processed'] - self.stats['total_labeled']}\n"
-        stats_str += f"\nUnique labels: {len(self.stats['labels_created'])}\n"
-        
-        if self.stats['labels_created']:
-            stats_str += "\nLabel counts:\n"
-            for label, count in sorted(self.stats['labels_created'].items()):
-                stats_str += f"  {label}: {count}\n"
+        # Save threads may be adding labels meanwhile
+        with self._stats_lock:
+            stats_str = f"Processed: {self.stats['total_processed']}\n"
+            stats_str += f"Labeled: {self.stats['total_labeled']}\n"
+            stats_str += f"Skipped: {self.stats['total_processed'] - self.stats['total_labeled']}\n"
+            stats_str += f"\nUnique labels: {len(self.stats['labels_created'])}\n"
+            
+            if self.stats['labels_created']:
+                stats_str += "\nLabel counts:\n"
+                for label, count in sorted(self.stats['labels_created'].items()):
+                    stats_str += f"  {label}: {count}\n"
         
         self.stats_text.insert('1.0', stats_str)
     
+    def _write_stats(self, pretty=False):
+        """Write stats via a temp file and rename (indented only for the final save)"""
+        stats_file = self.output_folder / "labeling_stats.json"
+        temp_file = stats_file.with_suffix('.tmp')
+        with open(temp_file, 'w') as f:
+            if pretty:
+                json.dump(self.stats, f, indent=2)
+            else:
+                json.dump(self.stats, f, separators=(',', ':'))
+        os.replace(temp_file, stats_file)
+        return stats_file
+    
     def finish_labeling(self):
         """User clicks Finish & Train button - ready to proceed with training"""
         # Check if user has labeled enough images
@@ -784,10 +929,9 @@ Tip: Zoom 200-300%, pan to corner, select tight!
         )
         
         if result:
-            # Save stats and close
-            stats_file = self.output_folder / "labeling_stats.json"
-            with open(stats_file, 'w') as f:
-                json.dump(self.stats, f, indent=2)
+            # Finish pending crop saves, then save stats and close
+            self._save_pool.shutdown(wait=True)
+            self._write_stats(pretty=True)
             
             messagebox.showinfo(
                 "Labeling Complete!",
@@ -800,10 +944,9 @@ Tip: Zoom 200-300%, pan to corner, select tight!
     
     def on_complete(self):
         """All images processed"""
-        # Save stats
-        stats_file = self.output_folder / "labeling_stats.json"
-        with open(stats_file, 'w') as f:
-            json.dump(self.stats, f, indent=2)
+        # Finish pending crop saves, then save stats
+        self._save_pool.shutdown(wait=True)
+        self._write_stats(pretty=True)
         
         messagebox.showinfo("Complete!", 
                            f"Labeling complete!\n\n"
@@ -818,14 +961,14 @@ Tip: Zoom 200-300%, pan to corner, select tight!
         """Window closing"""
         if messagebox.askyesno("Quit?", "Are you sure you want to quit?\nProgress will be saved."):
             try:
-                # Save stats
-                stats_file = self.output_folder / "labeling_stats.json"
-                with open(stats_file, 'w') as f:
-                    json.dump(self.stats, f, indent=2)
+                # Finish pending crop saves, then save stats
+                self._save_pool.shutdown(wait=True)
+                stats_file = self._write_stats()
                 print(f"[INFO] Stats saved to {stats_file}")
             except Exception as e:
                 print(f"[WARNING] Failed to save stats: {e}")
             finally:
+                _decode_display.cache_clear()
                 # Ensure window closes even if stats save fails
                 self.root.quit()  # Exit mainloop
                 self.root.destroy()  # Destroy window
@@ -3,15 +3,37 @@ Configuration management for AI Page Reordering Automation System
 """
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+@lru_cache(maxsize=256)
+def _split_key_path(key_path: str) -> Tuple[str, ...]:
+    """Split a dotted key path once - the same few paths are read for every page"""
+    return tuple(key_path.split('.'))
 
 class ConfigManager:
     """Manages configuration settings for the application"""
     
     def __init__(self, config_path: str = "config.json"):
         self.config_path = Path(config_path)
-        self.config = self._load_config()
+        self._config = None  # Loaded on first use, so --config never parses twice
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        if self._config is None:
+            self._config = self._load_config()
+        return self._config
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._config = value
+    
+    def reload(self, config_path: str = None) -> None:
+        """Load configuration again, optionally from a different file"""
+        if config_path is not None:
+            self.config_path = Path(config_path)
+        self._config = self._load_config()
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from JSON file"""
@@ -79,7 +101,7 @@ class ConfigManager:
         Get configuration value using dot notation
         Example: config.get('ocr.confidence_threshold')
         """
-        keys = key_path.split('.')
+        keys = _split_key_path(key_path)
         value = self.config
         
         try:
@@ -94,7 +116,7 @@ class ConfigManager:
         Set configuration value using dot notation
         Example: config.set('ocr.confidence_threshold', 90)
         """
-        keys = key_path.split('.')
+        keys = _split_key_path(key_path)
         config_ref = self.config
         
         # Navigate to the parent of the target key
@@ -106,6 +128,14 @@ class ConfigManager:
         # Set the final value
         config_ref[keys[-1]] = value
     
+    def update(self, values: Dict[str, Any]) -> None:
+        """
+        Set several configuration values in one call using dot notation
+        Example: config.update({'ocr.confidence_threshold': 90, 'preprocessing.denoise': False})
+        """
+        for key_path, value in values.items():
+            self.set(key_path, value)
+    
     def save(self) -> None:
         """Save current configuration to file"""
         try:
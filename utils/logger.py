@@ -2,11 +2,16 @@
 Logging system for AI Page Reordering Automation System
 """
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
+# File records are buffered and written in blocks instead of one write per line;
+# warnings and errors flush the buffer at once so nothing important is held back
+FILE_BUFFER_CAPACITY = 256
+
 class Logger:
     """Enhanced logging system with multiple output options"""
     
@@ -15,7 +20,12 @@ class Logger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.DEBUG)
         
-        # Clear existing handlers
+        # Clear existing handlers (closing flushes anything still buffered)
+        for handler in self.logger.handlers:
+            target = getattr(handler, 'target', None)
+            handler.close()
+            if target is not None:
+                target.close()
         self.logger.handlers.clear()
         
         # Create formatters
@@ -43,27 +53,36 @@ class Logger:
             file_handler = logging.FileHandler(log_path, encoding='utf-8')
             file_handler.setLevel(file_level)
             file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(file_handler)
+            buffered_handler = logging.handlers.MemoryHandler(
+                FILE_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=file_handler)
+            buffered_handler.setLevel(file_level)
+            self.logger.addHandler(buffered_handler)
     
-    def info(self, message: str) -> None:
+    # Extra args are %-formatted lazily by logging, only if the record is emitted
+    def info(self, message: str, *args) -> None:
         """Log info message"""
-        self.logger.info(message)
+        self.logger.info(message, *args)
     
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         """Log debug message"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
     
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """Log warning message"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
     
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         """Log error message"""
-        self.logger.error(message)
+        self.logger.error(message, *args)
     
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args) -> None:
         """Log critical message"""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
+    
+    def flush(self) -> None:
+        """Write out buffered log records"""
+        for handler in self.logger.handlers:
+            handler.flush()
     
     def progress(self, message: str, current: int, total: int) -> None:
         """Log progress message with percentage"""
@@ -110,6 +129,7 @@ class ProcessLogger:
             self.logger.success(f"Completed {self.process_name} in {duration.total_seconds():.2f}s")
         else:
             self.logger.failure(f"Failed {self.process_name} after {duration.total_seconds():.2f}s: {exc_val}")
+        self.logger.flush()
 
 # Create default logger instance
 def create_logger(log_file: Optional[str] = None, verbose: bool = False) -> Logger: